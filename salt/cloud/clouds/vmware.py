@@ -2715,6 +2715,29 @@ def destroy(name, call=None):
     return True
 
 
+def _get_folder_ref(si, folder, container_ref=None):
+    """
+    Return the folder reference for the given folder path, or None.
+
+    A full inventory path (e.g. 'dc1/vm/folder') is resolved by vCenter in a
+    single lookup, otherwise search for each part of the path in turn.
+    """
+    folder_ref = si.content.searchIndex.FindByInventoryPath(
+        inventoryPath=folder.strip("/")
+    )
+    if isinstance(folder_ref, vim.Folder):
+        return folder_ref
+    folder_ref = None
+    search_reference = container_ref
+    for folder_part in folder.split("/"):
+        if folder_part:
+            folder_ref = salt.utils.vmware.get_mor_by_property(
+                si, vim.Folder, folder_part, container_ref=search_reference
+            )
+            search_reference = folder_ref
+    return folder_ref
+
+
 def create(vm_):
     """
     To create a single VM in the VMware environment.
@@ -2913,14 +2936,7 @@ def create(vm_):
     # Either a datacenter or a folder can be optionally specified when cloning, required when creating.
     # If not specified when cloning, the existing VM/template\'s parent folder is used.
     if folder:
-        folder_parts = folder.split("/")
-        search_reference = container_ref
-        for folder_part in folder_parts:
-            if folder_part:
-                folder_ref = salt.utils.vmware.get_mor_by_property(
-                    si, vim.Folder, folder_part, container_ref=search_reference
-                )
-                search_reference = folder_ref
+        folder_ref = _get_folder_ref(si, folder, container_ref=container_ref)
         if not folder_ref:
             log.error("Specified folder: '%s' does not exist", folder)
             log.debug(
@@ -3247,7 +3263,18 @@ def create(vm_):
         if not template:
             clone_spec.powerOn = power
 
-        log.debug("clone_spec set to:\n%s", pprint.pformat(clone_spec))
+        if log.isEnabledFor(logging.DEBUG):
+            # Avoid pprint.pformat() here, it walks the whole pyVmomi object graph
+            log.debug(
+                "clone_spec set to: template=%s powerOn=%s numCPUs=%s memoryMB=%s"
+                " devices=%d extraConfig=%d",
+                clone_spec.template,
+                getattr(clone_spec, "powerOn", None),
+                config_spec.numCPUs,
+                config_spec.memoryMB,
+                len(config_spec.deviceChange or []),
+                len(config_spec.extraConfig or []),
+            )
 
     else:
         config_spec.name = vm_name
@@ -3255,7 +3282,8 @@ def create(vm_):
         config_spec.files.vmPathName = "[{0}] {1}/{1}.vmx".format(datastore, vm_name)
         config_spec.guestId = guest_id
 
-        log.debug("config_spec set to:\n%s", pprint.pformat(config_spec))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("config_spec set to:\n%s", pprint.pformat(config_spec))
 
     event_kwargs = vm_.copy()
     if event_kwargs.get("password"):
@@ -3338,8 +3366,7 @@ def create(vm_):
             task = new_vm_ref.PowerOn()
             salt.utils.vmware.wait_for_task(task, vm_name, "power", 5, "info")
     except Exception as exc:  # pylint: disable=broad-except
-        log.info("Powering on the VM threw this exception. Ignoring.")
-        log.info(exc)
+        log.info("Powering on the VM threw this exception. Ignoring: %s", exc)
 
     # If it a template or if it does not need to be powered on then do not wait for the IP
     out = None
@@ -78,13 +78,19 @@ as a passed in dict, or as a string to pull from pillars or minion config:
 # pylint: disable=E0602
 
 
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import mmap
+import os
 import random
 import time
 
 import salt.utils.compat
 import salt.utils.files
 import salt.utils.json
+import salt.utils.stringutils
 import salt.utils.versions
 from salt.exceptions import SaltInvocationError
 
@@ -108,6 +114,33 @@ except ImportError:
     HAS_BOTO = False
 # pylint: enable=import-error
 
+# Properties returned by the describe/update functions
+_FUNCTION_KEYS = (
+    "FunctionName",
+    "Runtime",
+    "Role",
+    "Handler",
+    "CodeSha256",
+    "CodeSize",
+    "Description",
+    "Timeout",
+    "MemorySize",
+    "FunctionArn",
+    "LastModified",
+    "VpcConfig",
+    "Environment",
+)
+_EVENT_SOURCE_MAPPING_KEYS = (
+    "UUID",
+    "BatchSize",
+    "EventSourceArn",
+    "FunctionArn",
+    "LastModified",
+    "LastProcessingResult",
+    "State",
+    "StateTransitionReason",
+)
+
 __deprecated__ = (
     3009,
     "boto",
@@ -134,17 +167,89 @@ def __init__(opts):
         __utils__["boto3.assign_funcs"](__name__, "lambda")
 
 
+# Seconds a _find_function/_find_alias result is reused for
+_LOOKUP_CACHE_TTL = 30
+
+
+def _lookup_function_name(FunctionName):
+    """
+    Return the bare function name of a function given by name, partial or
+    full ARN, and its version or alias qualifier (or an empty string).
+    """
+    name = FunctionName.split(":function:", 1)[-1]
+    name, _, qualifier = name.partition(":")
+    return name, qualifier
+
+
+def _lookup_cache(func):
+    """
+    Cache lookup results in __context__ for a short while, so the usual
+    ``*_exists`` followed by ``describe_*``/``create_*`` pattern only costs a
+    single API call. Write paths drop the entries via ``_invalidate_lookups``.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        FunctionName, *args, region=None, key=None, keyid=None, profile=None, **kwargs
+    ):
+        # Like the boto connection cache, only keep a hash of the credentials
+        conn_hash = hashlib.sha256(
+            salt.utils.stringutils.to_bytes(
+                salt.utils.json.dumps([region, key, keyid, profile], sort_keys=True)
+            )
+        ).hexdigest()
+        cache_key = (
+            _lookup_function_name(FunctionName),
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+            conn_hash,
+        )
+        cache = __context__.setdefault("boto_lambda.lookups", {})
+        now = time.monotonic()
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        ret = func(
+            FunctionName,
+            *args,
+            region=region,
+            key=key,
+            keyid=keyid,
+            profile=profile,
+            **kwargs,
+        )
+        cache[cache_key] = (now + _LOOKUP_CACHE_TTL, ret)
+        return ret
+
+    return wrapper
+
+
+def _invalidate_lookups(FunctionName):
+    """
+    Forget any cached function or alias lookups for the given function, by
+    name or ARN and with any qualifier.
+    """
+    cache = __context__.get("boto_lambda.lookups")
+    if cache:
+        name = _lookup_function_name(FunctionName)[0]
+        for cache_key in [k for k in cache if k[0][0] == name]:
+            del cache[cache_key]
+
+
+@_lookup_cache
 def _find_function(name, region=None, key=None, keyid=None, profile=None):
     """
     Given function name, find and return matching Lambda information.
     """
     conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
 
-    for funcs in __utils__["boto3.paged_call"](conn.list_functions):
-        for func in funcs["Functions"]:
-            if func["FunctionName"] == name:
-                return func
-    return None
+    try:
+        return conn.get_function_configuration(FunctionName=name)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+            return None
+        raise
 
 
 def function_exists(FunctionName, region=None, key=None, keyid=None, profile=None):
@@ -172,22 +277,35 @@ def function_exists(FunctionName, region=None, key=None, keyid=None, profile=Non
 
 
 def _get_role_arn(name, region=None, key=None, keyid=None, profile=None):
-    if name.startswith("arn:aws:iam:"):
+    # Any ARN (including other partitions such as aws-cn) is taken as-is
+    if name.startswith("arn:"):
         return name
 
     account_id = __salt__["boto_iam.get_account_id"](
         region=region, key=key, keyid=keyid, profile=profile
     )
-    if profile and "region" in profile:
-        region = profile["region"]
-    if region is None:
-        region = "us-east-1"
     return f"arn:aws:iam::{account_id}:role/{name}"
 
 
 def _filedata(infile):
+    """
+    Map the given file read-only instead of copying it into memory. The
+    mapping keeps its own handle on the file, so ``f`` can be closed here,
+    the caller closes the mapping with ``_close_filedata``.
+    """
     with salt.utils.files.fopen(infile, "rb") as f:
-        return f.read()
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses to map empty files
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _close_filedata(data):
+    """
+    Close a mapping returned by ``_filedata``.
+    """
+    if isinstance(data, mmap.mmap):
+        data.close()
 
 
 def _resolve_vpcconfig(conf, region=None, key=None, keyid=None, profile=None):
@@ -265,7 +383,9 @@ def create_function(
 
     """
 
+    _invalidate_lookups(FunctionName)
     role_arn = _get_role_arn(Role, region=region, key=key, keyid=keyid, profile=profile)
+    zipdata = None
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         if ZipFile:
@@ -281,8 +401,9 @@ def create_function(
                     ret["comment"] = f"Failed to cache ZipFile `{ZipFile}`."
                     return ret
                 ZipFile = dlZipFile
+            zipdata = _filedata(ZipFile)
             code = {
-                "ZipFile": _filedata(ZipFile),
+                "ZipFile": zipdata,
             }
         else:
             if not S3Bucket or not S3Key:
@@ -349,6 +470,8 @@ def create_function(
             return {"created": False}
     except ClientError as e:
         return {"created": False, "error": __utils__["boto3.get_error"](e)}
+    finally:
+        _close_filedata(zipdata)
 
 
 def delete_function(
@@ -368,6 +491,7 @@ def delete_function(
 
     """
 
+    _invalidate_lookups(FunctionName)
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         if Qualifier:
@@ -398,22 +522,7 @@ def describe_function(FunctionName, region=None, key=None, keyid=None, profile=N
             FunctionName, region=region, key=key, keyid=keyid, profile=profile
         )
         if func:
-            keys = (
-                "FunctionName",
-                "Runtime",
-                "Role",
-                "Handler",
-                "CodeSha256",
-                "CodeSize",
-                "Description",
-                "Timeout",
-                "MemorySize",
-                "FunctionArn",
-                "LastModified",
-                "VpcConfig",
-                "Environment",
-            )
-            return {"function": {k: func.get(k) for k in keys}}
+            return {"function": {k: func.get(k) for k in _FUNCTION_KEYS}}
         else:
             return {"function": None}
     except ClientError as e:
@@ -464,6 +573,7 @@ def update_function_config(
 
     """
 
+    _invalidate_lookups(FunctionName)
     args = dict(FunctionName=FunctionName)
     options = {
         "Handler": Handler,
@@ -512,22 +622,7 @@ def update_function_config(
             else:
                 break
         if r:
-            keys = (
-                "FunctionName",
-                "Runtime",
-                "Role",
-                "Handler",
-                "CodeSha256",
-                "CodeSize",
-                "Description",
-                "Timeout",
-                "MemorySize",
-                "FunctionArn",
-                "LastModified",
-                "VpcConfig",
-                "Environment",
-            )
-            return {"updated": True, "function": {k: r.get(k) for k in keys}}
+            return {"updated": True, "function": {k: r.get(k) for k in _FUNCTION_KEYS}}
         else:
             log.warning("Function was not updated")
             return {"updated": False}
@@ -561,6 +656,7 @@ def update_function_code(
 
     """
 
+    _invalidate_lookups(FunctionName)
     conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
     try:
         if ZipFile:
@@ -569,9 +665,13 @@ def update_function_code(
                     "Either ZipFile must be specified, or "
                     "S3Bucket and S3Key must be provided."
                 )
-            r = conn.update_function_code(
-                FunctionName=FunctionName, ZipFile=_filedata(ZipFile), Publish=Publish
-            )
+            zipdata = _filedata(ZipFile)
+            try:
+                r = conn.update_function_code(
+                    FunctionName=FunctionName, ZipFile=zipdata, Publish=Publish
+                )
+            finally:
+                _close_filedata(zipdata)
         else:
             if not S3Bucket or not S3Key:
                 raise SaltInvocationError(
@@ -588,22 +688,7 @@ def update_function_code(
                 FunctionName=FunctionName, Publish=Publish, **args
             )
         if r:
-            keys = (
-                "FunctionName",
-                "Runtime",
-                "Role",
-                "Handler",
-                "CodeSha256",
-                "CodeSize",
-                "Description",
-                "Timeout",
-                "MemorySize",
-                "FunctionArn",
-                "LastModified",
-                "VpcConfig",
-                "Environment",
-            )
-            return {"updated": True, "function": {k: r.get(k) for k in keys}}
+            return {"updated": True, "function": {k: r.get(k) for k in _FUNCTION_KEYS}}
         else:
             log.warning("Function was not updated")
             return {"updated": False}
@@ -824,6 +909,7 @@ def create_alias(
         salt myminion boto_lamba.create_alias my_function my_alias $LATEST "An alias"
 
     """
+    _invalidate_lookups(FunctionName)
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         alias = conn.create_alias(
@@ -858,6 +944,7 @@ def delete_alias(FunctionName, Name, region=None, key=None, keyid=None, profile=
 
     """
 
+    _invalidate_lookups(FunctionName)
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         conn.delete_alias(FunctionName=FunctionName, Name=Name)
@@ -866,6 +953,7 @@ def delete_alias(FunctionName, Name, region=None, key=None, keyid=None, profile=
         return {"deleted": False, "error": __utils__["boto3.get_error"](e)}
 
 
+@_lookup_cache
 def _find_alias(
     FunctionName,
     Name,
@@ -880,15 +968,15 @@ def _find_alias(
     """
     conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
 
-    args = {"FunctionName": FunctionName}
-    if FunctionVersion:
-        args["FunctionVersion"] = FunctionVersion
-
-    for aliases in __utils__["boto3.paged_call"](conn.list_aliases, **args):
-        for alias in aliases.get("Aliases"):
-            if alias["Name"] == Name:
-                return alias
-    return None
+    try:
+        alias = conn.get_alias(FunctionName=FunctionName, Name=Name)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+            return None
+        raise
+    if FunctionVersion and alias.get("FunctionVersion") != FunctionVersion:
+        return None
+    return alias
 
 
 def alias_exists(FunctionName, Name, region=None, key=None, keyid=None, profile=None):
@@ -966,6 +1054,7 @@ def update_alias(
 
     """
 
+    _invalidate_lookups(FunctionName)
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         args = {}
@@ -1060,6 +1149,24 @@ def get_event_source_mapping_ids(
         return {"error": __utils__["boto3.get_error"](e)}
 
 
+def _check_ids_args(UUID, EventSourceArn, FunctionName):
+    """
+    Raise unless either UUID or both EventSourceArn and FunctionName are
+    given.
+    """
+    if UUID:
+        if EventSourceArn or FunctionName:
+            raise SaltInvocationError(
+                "Either UUID must be specified, or "
+                "EventSourceArn and FunctionName must be provided."
+            )
+    elif not EventSourceArn or not FunctionName:
+        raise SaltInvocationError(
+            "Either UUID must be specified, or "
+            "EventSourceArn and FunctionName must be provided."
+        )
+
+
 def _get_ids(
     UUID=None,
     EventSourceArn=None,
@@ -1069,19 +1176,10 @@ def _get_ids(
     keyid=None,
     profile=None,
 ):
+    _check_ids_args(UUID, EventSourceArn, FunctionName)
     if UUID:
-        if EventSourceArn or FunctionName:
-            raise SaltInvocationError(
-                "Either UUID must be specified, or "
-                "EventSourceArn and FunctionName must be provided."
-            )
         return [UUID]
     else:
-        if not EventSourceArn or not FunctionName:
-            raise SaltInvocationError(
-                "Either UUID must be specified, or "
-                "EventSourceArn and FunctionName must be provided."
-            )
         return get_event_source_mapping_ids(
             EventSourceArn=EventSourceArn,
             FunctionName=FunctionName,
@@ -1092,6 +1190,43 @@ def _get_ids(
         )
 
 
+def _find_event_source_mapping(
+    UUID=None,
+    EventSourceArn=None,
+    FunctionName=None,
+    region=None,
+    key=None,
+    keyid=None,
+    profile=None,
+):
+    """
+    Given an event source mapping ID or an event source ARN and FunctionName,
+    find and return the first matching mapping with a single API call.
+    """
+    _check_ids_args(UUID, EventSourceArn, FunctionName)
+
+    conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
+    if UUID:
+        try:
+            return conn.get_event_source_mapping(UUID=UUID)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+                return None
+            raise
+
+    # The listing already carries the full mapping, no need to fetch it again.
+    # Only the first one is used, so don't have the service return the rest.
+    for maps in __utils__["boto3.paged_call"](
+        conn.list_event_source_mappings,
+        EventSourceArn=EventSourceArn,
+        FunctionName=FunctionName,
+        MaxItems=1,
+    ):
+        if maps["EventSourceMappings"]:
+            return maps["EventSourceMappings"][0]
+    return None
+
+
 def delete_event_source_mapping(
     UUID=None,
     EventSourceArn=None,
@@ -1106,7 +1241,9 @@ def delete_event_source_mapping(
     delete the event source mapping
 
     Returns {deleted: true} if the mapping was deleted and returns
-    {deleted: false} if the mapping was not deleted.
+    {deleted: false} if the mapping was not deleted. If several mappings match
+    and some of them fail to delete, ``errors`` maps the UUID of each failed
+    mapping to its error, and ``error`` holds the first of them.
 
     CLI Example:
 
@@ -1115,14 +1252,42 @@ def delete_event_source_mapping(
         salt myminion boto_lambda.delete_event_source_mapping 260c423d-e8b5-4443-8d6a-5e91b9ecd0fa
 
     """
-    ids = _get_ids(UUID, EventSourceArn=EventSourceArn, FunctionName=FunctionName)
+    ids = _get_ids(
+        UUID,
+        EventSourceArn=EventSourceArn,
+        FunctionName=FunctionName,
+        region=region,
+        key=key,
+        keyid=keyid,
+        profile=profile,
+    )
+    if isinstance(ids, dict):
+        return {"deleted": False, "error": ids["error"]}
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
-        for id in ids:
-            conn.delete_event_source_mapping(UUID=id)
-        return {"deleted": True}
     except ClientError as e:
         return {"deleted": False, "error": __utils__["boto3.get_error"](e)}
+    # boto3 clients are thread-safe, so issue the deletes concurrently and
+    # report the failures once every delete has been attempted.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(8, len(ids)))
+    ) as executor:
+        futures = {
+            id: executor.submit(conn.delete_event_source_mapping, UUID=id) for id in ids
+        }
+    errors = {}
+    for id, future in futures.items():
+        try:
+            future.result()
+        except ClientError as e:
+            errors[id] = __utils__["boto3.get_error"](e)
+    if errors:
+        return {
+            "deleted": False,
+            "error": next(iter(errors.values())),
+            "errors": errors,
+        }
+    return {"deleted": True}
 
 
 def event_source_mapping_exists(
@@ -1149,18 +1314,19 @@ def event_source_mapping_exists(
 
     """
 
-    desc = describe_event_source_mapping(
-        UUID=UUID,
-        EventSourceArn=EventSourceArn,
-        FunctionName=FunctionName,
-        region=region,
-        key=key,
-        keyid=keyid,
-        profile=profile,
-    )
-    if "error" in desc:
-        return desc
-    return {"exists": bool(desc.get("event_source_mapping"))}
+    try:
+        desc = _find_event_source_mapping(
+            UUID=UUID,
+            EventSourceArn=EventSourceArn,
+            FunctionName=FunctionName,
+            region=region,
+            key=key,
+            keyid=keyid,
+            profile=profile,
+        )
+        return {"exists": bool(desc)}
+    except ClientError as e:
+        return {"error": __utils__["boto3.get_error"](e)}
 
 
 def describe_event_source_mapping(
@@ -1185,26 +1351,22 @@ def describe_event_source_mapping(
         salt myminion boto_lambda.describe_event_source_mapping uuid
 
     """
-    ids = _get_ids(UUID, EventSourceArn=EventSourceArn, FunctionName=FunctionName)
-    if not ids:
-        return {"event_source_mapping": None}
-
-    UUID = ids[0]
     try:
-        conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
-        desc = conn.get_event_source_mapping(UUID=UUID)
+        desc = _find_event_source_mapping(
+            UUID=UUID,
+            EventSourceArn=EventSourceArn,
+            FunctionName=FunctionName,
+            region=region,
+            key=key,
+            keyid=keyid,
+            profile=profile,
+        )
         if desc:
-            keys = (
-                "UUID",
-                "BatchSize",
-                "EventSourceArn",
-                "FunctionArn",
-                "LastModified",
-                "LastProcessingResult",
-                "State",
-                "StateTransitionReason",
-            )
-            return {"event_source_mapping": {k: desc.get(k) for k in keys}}
+            return {
+                "event_source_mapping": {
+                    k: desc.get(k) for k in _EVENT_SOURCE_MAPPING_KEYS
+                }
+            }
         else:
             return {"event_source_mapping": None}
     except ClientError as e:
@@ -1246,19 +1408,11 @@ def update_event_source_mapping(
             args["BatchSize"] = BatchSize
         r = conn.update_event_source_mapping(UUID=UUID, **args)
         if r:
-            keys = (
-                "UUID",
-                "BatchSize",
-                "EventSourceArn",
-                "FunctionArn",
-                "LastModified",
-                "LastProcessingResult",
-                "State",
-                "StateTransitionReason",
-            )
             return {
                 "updated": True,
-                "event_source_mapping": {k: r.get(k) for k in keys},
+                "event_source_mapping": {
+                    k: r.get(k) for k in _EVENT_SOURCE_MAPPING_KEYS
+                },
             }
         else:
             log.warning("Mapping was not updated")
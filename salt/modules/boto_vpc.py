@@ -201,6 +201,58 @@ def __init__(opts):
         )
 
 
+# Seconds an id-only ``*_exists`` answer is reused for
+_EXISTS_CACHE_TTL = 10
+
+# Maximum number of ids sent with a single Describe* request
+_DESCRIBE_CHUNK_SIZE = 100
+
+
+def _exists_cache_key(resource, resource_id, region, key, keyid, profile):
+    if isinstance(profile, dict):
+        profile = tuple(sorted(profile.items()))
+    return (resource, resource_id, region, key, keyid, profile)
+
+
+def _get_cached_exists(resource, resource_id, region, key, keyid, profile):
+    """
+    Return a cached ``{"exists": ...}`` answer for a resource id, or None.
+    """
+    cache = __context__.get("boto_vpc.exists")
+    if not cache:
+        return None
+    cached = cache.get(
+        _exists_cache_key(resource, resource_id, region, key, keyid, profile)
+    )
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _set_cached_exists(resource, resource_id, ret, region, key, keyid, profile):
+    """
+    Remember an ``{"exists": ...}`` answer for a resource id. Errors are
+    never cached.
+    """
+    if "exists" not in ret:
+        return
+    cache = __context__.setdefault("boto_vpc.exists", {})
+    cache[_exists_cache_key(resource, resource_id, region, key, keyid, profile)] = (
+        time.monotonic() + _EXISTS_CACHE_TTL,
+        ret,
+    )
+
+
+def _invalidate_exists(resource, resource_id):
+    """
+    Forget any cached ``*_exists`` answers for the given resource id.
+    """
+    cache = __context__.get("boto_vpc.exists")
+    if cache:
+        for cache_key in [k for k in cache if k[0] == resource and k[1] == resource_id]:
+            del cache[cache_key]
+
+
 def check_vpc(
     vpc_id=None,
     vpc_name=None,
@@ -281,8 +333,7 @@ def _create_resource(
                 return {"created": True}
             else:
                 log.info("A %s with id %s was created", resource, r.id)
-                _maybe_set_name_tag(name, r)
-                _maybe_set_tags(tags, r)
+                _maybe_set_tags(tags, r, name=name)
 
                 if name:
                     _cache_id(
@@ -306,6 +357,42 @@ def _create_resource(
         return {"created": False, "error": __utils__["boto.get_error"](e)}
 
 
+def _rollback_create(
+    resource,
+    resource_id,
+    name=None,
+    region=None,
+    key=None,
+    keyid=None,
+    profile=None,
+):
+    """
+    Delete a resource that was just created, because a follow-up call on it
+    failed. A failure to clean up is logged, the original error is what the
+    caller reports.
+    """
+
+    try:
+        conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
+        getattr(conn, "delete_" + resource)(resource_id)
+    except BotoServerError as e:
+        log.error("Unable to roll back %s %s: %s", resource, resource_id, e)
+        return
+    log.info("Rolled back %s %s", resource, resource_id)
+    _invalidate_exists(resource, resource_id)
+    if name:
+        _cache_id(
+            name,
+            sub_resource=resource,
+            resource_id=resource_id,
+            invalidate=True,
+            region=region,
+            key=key,
+            keyid=keyid,
+            profile=profile,
+        )
+
+
 def _delete_resource(
     resource,
     name=None,
@@ -345,6 +432,7 @@ def _delete_resource(
                 }
 
         if delete_resource(resource_id, **kwargs):
+            _invalidate_exists(resource, resource_id)
             _cache_id(
                 name,
                 sub_resource=resource,
@@ -552,8 +640,14 @@ def resource_exists(
 
     """
 
+    by_id = resource_id and not any((name, tags))
+    if by_id:
+        cached = _get_cached_exists(resource, resource_id, region, key, keyid, profile)
+        if cached is not None:
+            return cached
+
     try:
-        return {
+        ret = {
             "exists": bool(
                 _find_resources(
                     resource,
@@ -570,6 +664,50 @@ def resource_exists(
     except BotoServerError as e:
         return {"error": __utils__["boto.get_error"](e)}
 
+    if by_id:
+        _set_cached_exists(resource, resource_id, ret, region, key, keyid, profile)
+    return ret
+
+
+def _resources_exist(
+    resource, resource_ids, region=None, key=None, keyid=None, profile=None
+):
+    """
+    Check which of the given resource ids exist, looking them up
+    ``_DESCRIBE_CHUNK_SIZE`` at a time. Returns a dict mapping each id to
+    True or False.
+    """
+
+    conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
+
+    f = f"get_all_{resource}"
+    if not f.endswith("s"):
+        f = f + "s"
+    get_resources = getattr(conn, f)
+    # filtering on the id, rather than passing <resource>_ids, means unknown
+    # ids are simply missing from the result instead of failing the request
+    filter_name = "{}-id".format(resource.replace("_", "-"))
+
+    resource_ids = list(resource_ids)
+    found = set()
+    for i in range(0, len(resource_ids), _DESCRIBE_CHUNK_SIZE):
+        chunk = resource_ids[i : i + _DESCRIBE_CHUNK_SIZE]
+        found.update(r.id for r in get_resources(filters={filter_name: chunk}))
+
+    ret = {}
+    for resource_id in resource_ids:
+        ret[resource_id] = resource_id in found
+        _set_cached_exists(
+            resource,
+            resource_id,
+            {"exists": ret[resource_id]},
+            region,
+            key,
+            keyid,
+            profile,
+        )
+    return ret
+
 
 def _find_vpcs(
     vpc_id=None,
@@ -742,6 +880,12 @@ def exists(
             "provided: vpc_id, vpc_name, cidr or tags."
         )
 
+    by_id = vpc_id and not any((name, tags, cidr))
+    if by_id:
+        cached = _get_cached_exists("vpc", vpc_id, region, key, keyid, profile)
+        if cached is not None:
+            return cached
+
     try:
         vpc_ids = _find_vpcs(
             vpc_id=vpc_id,
@@ -755,12 +899,42 @@ def exists(
         )
     except BotoServerError as err:
         boto_err = __utils__["boto.get_error"](err)
-        if boto_err.get("aws", {}).get("code") == "InvalidVpcID.NotFound":
-            # VPC was not found: handle the error and return False.
-            return {"exists": False}
-        return {"error": boto_err}
+        if boto_err.get("aws", {}).get("code") != "InvalidVpcID.NotFound":
+            return {"error": boto_err}
+        # VPC was not found: handle the error and return False.
+        vpc_ids = []
+
+    ret = {"exists": bool(vpc_ids)}
+    if by_id:
+        _set_cached_exists("vpc", vpc_id, ret, region, key, keyid, profile)
+    return ret
+
+
+def vpcs_exist(vpc_ids, region=None, key=None, keyid=None, profile=None):
+    """
+    Given a list of VPC IDs, check which of them exist using as few API
+    requests as possible.
 
-    return {"exists": bool(vpc_ids)}
+    Returns {exists: {<vpc_id>: true|false, ...}} or {error: ...}.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt myminion boto_vpc.vpcs_exist '["vpc-6b1fe402", "vpc-7c2a1b33"]'
+
+    """
+
+    if isinstance(vpc_ids, str):
+        vpc_ids = [vpc_ids]
+    try:
+        return {
+            "exists": _resources_exist(
+                "vpc", vpc_ids, region=region, key=key, keyid=keyid, profile=profile
+            )
+        }
+    except BotoServerError as e:
+        return {"error": __utils__["boto.get_error"](e)}
 
 
 def create(
@@ -800,8 +974,7 @@ def create(
         if vpc:
             log.info("The newly created VPC id is %s", vpc.id)
 
-            _maybe_set_name_tag(vpc_name, vpc)
-            _maybe_set_tags(tags, vpc)
+            _maybe_set_tags(tags, vpc, name=vpc_name)
             _maybe_set_dns(conn, vpc.id, enable_dns_support, enable_dns_hostnames)
             _maybe_name_route_table(conn, vpc.id, vpc_name)
             if vpc_name:
@@ -875,6 +1048,7 @@ def delete(
 
         if conn.delete_vpc(vpc_id):
             log.info("VPC %s was deleted.", vpc_id)
+            _invalidate_exists("vpc", vpc_id)
             if vpc_name:
                 _cache_id(
                     vpc_name,
@@ -1208,6 +1382,12 @@ def subnet_exists(
             "tags, or zones."
         )
 
+    by_id = subnet_id and not any((subnet_name, cidr, tags, zones))
+    if by_id:
+        cached = _get_cached_exists("subnet", subnet_id, region, key, keyid, profile)
+        if cached is not None:
+            return cached
+
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
     except BotoServerError as err:
@@ -1230,10 +1410,10 @@ def subnet_exists(
         subnets = conn.get_all_subnets(**filter_parameters)
     except BotoServerError as err:
         boto_err = __utils__["boto.get_error"](err)
-        if boto_err.get("aws", {}).get("code") == "InvalidSubnetID.NotFound":
-            # Subnet was not found: handle the error and return False.
-            return {"exists": False}
-        return {"error": boto_err}
+        if boto_err.get("aws", {}).get("code") != "InvalidSubnetID.NotFound":
+            return {"error": boto_err}
+        # Subnet was not found: handle the error and return False.
+        subnets = []
 
     log.debug(
         "The filters criteria %s matched the following subnets:%s",
@@ -1242,10 +1422,55 @@ def subnet_exists(
     )
     if subnets:
         log.info("Subnet %s exists.", subnet_name or subnet_id)
-        return {"exists": True}
+        ret = {"exists": True}
     else:
         log.info("Subnet %s does not exist.", subnet_name or subnet_id)
-        return {"exists": False}
+        ret = {"exists": False}
+
+    if by_id:
+        _set_cached_exists("subnet", subnet_id, ret, region, key, keyid, profile)
+    return ret
+
+
+def subnets_exist(subnet_ids, region=None, key=None, keyid=None, profile=None):
+    """
+    Given a list of subnet IDs, check which of them exist using as few API
+    requests as possible.
+
+    Returns {exists: {<subnet_id>: true|false, ...}} or {error: ...}.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt myminion boto_vpc.subnets_exist '["subnet-6a1fe403", "subnet-2cb9785b"]'
+
+    """
+
+    if isinstance(subnet_ids, str):
+        subnet_ids = [subnet_ids]
+    try:
+        return {
+            "exists": _resources_exist(
+                "subnet",
+                subnet_ids,
+                region=region,
+                key=key,
+                keyid=keyid,
+                profile=profile,
+            )
+        }
+    except BotoServerError as e:
+        return {"error": __utils__["boto.get_error"](e)}
+
+
+def _iter_subnets(conn, subnet_ids, chunk_size=_DESCRIBE_CHUNK_SIZE):
+    """
+    Look up the given subnet ids ``chunk_size`` at a time and yield the
+    Subnet objects of every chunk.
+    """
+    for i in range(0, len(subnet_ids), chunk_size):
+        yield from conn.get_all_subnets(subnet_ids=subnet_ids[i : i + chunk_size])
 
 
 def get_subnet_association(subnets, region=None, key=None, keyid=None, profile=None):
@@ -1268,24 +1493,19 @@ def get_subnet_association(subnets, region=None, key=None, keyid=None, profile=N
         salt myminion boto_vpc.get_subnet_association ['subnet-61b47516','subnet-2cb9785b']
 
     """
+    if isinstance(subnets, str):
+        subnets = [subnets]
+    # using a set to store vpc_ids - the use of set prevents duplicate
+    # vpc_id values
+    vpc_ids = set()
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
-
-        # subnet_ids=subnets can accept either a string or a list
-        subnets = conn.get_all_subnets(subnet_ids=subnets)
+        for subnet in _iter_subnets(conn, subnets):
+            vpc_ids.add(subnet.vpc_id)
     except BotoServerError as e:
         return {"error": __utils__["boto.get_error"](e)}
 
-    # using a set to store vpc_ids - the use of set prevents duplicate
-    # vpc_id values
-    vpc_ids = set()
-    for subnet in subnets:
-        log.debug("examining subnet id: %s for vpc_id", subnet.id)
-        if subnet in subnets:
-            log.debug(
-                "subnet id: %s is associated with vpc id: %s", subnet.id, subnet.vpc_id
-            )
-            vpc_ids.add(subnet.vpc_id)
+    log.debug("subnets %s are associated with vpc ids: %s", subnets, vpc_ids)
     if not vpc_ids:
         return {"vpc_id": None}
     elif len(vpc_ids) == 1:
@@ -2049,7 +2269,19 @@ def create_dhcp_options(
         )
         if r.get("created") and vpc_id:
             conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
-            conn.associate_dhcp_options(r["id"], vpc_id)
+            try:
+                conn.associate_dhcp_options(r["id"], vpc_id)
+            except BotoServerError:
+                _rollback_create(
+                    "dhcp_options",
+                    r["id"],
+                    name=dhcp_options_name,
+                    region=region,
+                    key=key,
+                    keyid=keyid,
+                    profile=profile,
+                )
+                raise
             log.info("Associated options %s to VPC %s", r["id"], vpc_name or vpc_id)
         return r
     except BotoServerError as e:
@@ -2321,6 +2553,15 @@ def create_network_acl(
             conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
             association_id = conn.associate_network_acl(r["id"], subnet_id)
         except BotoServerError as e:
+            _rollback_create(
+                "network_acl",
+                r["id"],
+                name=network_acl_name,
+                region=region,
+                key=key,
+                keyid=keyid,
+                profile=profile,
+            )
             return {"created": False, "error": __utils__["boto.get_error"](e)}
         r["association_id"] = association_id
     return r
@@ -2550,6 +2791,20 @@ def disassociate_network_acl(
         return {"disassociated": False, "error": __utils__["boto.get_error"](e)}
 
 
+def _protocol_number(protocol):
+    """
+    Translate a protocol name ("tcp", "all", ...) to the number AWS expects.
+    """
+    if isinstance(protocol, str):
+        if protocol == "all":
+            return -1
+        try:
+            return socket.getprotobyname(protocol)
+        except OSError as e:
+            raise SaltInvocationError(e)
+    return protocol
+
+
 def _create_network_acl_entry(
     network_acl_id=None,
     rule_number=None,
@@ -2601,14 +2856,7 @@ def _create_network_acl_entry(
             },
         }
 
-    if isinstance(protocol, str):
-        if protocol == "all":
-            protocol = -1
-        else:
-            try:
-                protocol = socket.getprotobyname(protocol)
-            except OSError as e:
-                raise SaltInvocationError(e)
+    protocol = _protocol_number(protocol)
     try:
         conn = _get_conn(region=region, key=key, keyid=keyid, profile=profile)
         if replace:
@@ -2703,6 +2951,137 @@ def replace_network_acl_entry(
     return _create_network_acl_entry(replace=True, **kwargs)
 
 
+def _is_egress(egress):
+    return str(egress).lower() == "true"
+
+
+def _network_acl_entry_matches(current, entry):
+    """
+    Compare a boto NetworkAclEntry with an entry dict as accepted by
+    create_network_acl_entry. boto hands back every field as a string.
+    """
+    wanted = (
+        _protocol_number(entry.get("protocol")),
+        entry.get("rule_action"),
+        entry.get("cidr_block"),
+        entry.get("icmp_code"),
+        entry.get("icmp_type"),
+        entry.get("port_range_from"),
+        entry.get("port_range_to"),
+    )
+    have = (
+        current.protocol,
+        current.rule_action,
+        current.cidr_block,
+        current.icmp.code,
+        current.icmp.type,
+        current.port_range.from_port,
+        current.port_range.to_port,
+    )
+    return [str(v) for v in wanted] == [str(v) for v in have]
+
+
+def apply_network_acl_entries(
+    entries,
+    network_acl_id=None,
+    network_acl_name=None,
+    region=None,
+    key=None,
+    keyid=None,
+    profile=None,
+):
+    """
+    Make sure a list of entries is present in a network acl. The acl is
+    described once, and only the entries that are missing or differ are
+    created or replaced; entries that are not listed are left alone.
+
+    ``entries`` is a list of dicts taking the same arguments as
+    create_network_acl_entry (rule_number, protocol, rule_action,
+    cidr_block, egress, icmp_code, icmp_type, port_range_from,
+    port_range_to).
+
+    Returns {applied: true, created: [...], replaced: [...], unchanged: [...]}
+    with the rule numbers in each list, or {applied: false, error: ...}.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt myminion boto_vpc.apply_network_acl_entries \
+                '[{"rule_number": 100, "protocol": "tcp", "rule_action": "allow", \
+                "cidr_block": "10.0.0.0/16", "port_range_from": 443, \
+                "port_range_to": 443}]' network_acl_id='acl-5fb85d36'
+
+    """
+
+    if not _exactly_one((network_acl_name, network_acl_id)):
+        raise SaltInvocationError(
+            "One (but not both) of network_acl_id or network_acl_name must be provided."
+        )
+
+    try:
+        if network_acl_name:
+            acl = _get_resource(
+                "network_acl",
+                name=network_acl_name,
+                region=region,
+                key=key,
+                keyid=keyid,
+                profile=profile,
+            )
+        else:
+            acl = _get_resource(
+                "network_acl",
+                resource_id=network_acl_id,
+                region=region,
+                key=key,
+                keyid=keyid,
+                profile=profile,
+            )
+    except BotoServerError as e:
+        return {"applied": False, "error": __utils__["boto.get_error"](e)}
+    if not acl:
+        return {
+            "applied": False,
+            "error": {
+                "message": "Network ACL {} does not exist.".format(
+                    network_acl_name or network_acl_id
+                )
+            },
+        }
+
+    existing = {
+        (int(current.rule_number), _is_egress(current.egress)): current
+        for current in acl.network_acl_entries
+    }
+    ret = {"applied": True, "created": [], "replaced": [], "unchanged": []}
+    for entry in entries:
+        current = existing.get(
+            (int(entry["rule_number"]), _is_egress(entry.get("egress")))
+        )
+        if current is not None and _network_acl_entry_matches(current, entry):
+            ret["unchanged"].append(entry["rule_number"])
+            continue
+        replace = current is not None
+        r = _create_network_acl_entry(
+            network_acl_id=acl.id,
+            replace=replace,
+            region=region,
+            key=key,
+            keyid=keyid,
+            profile=profile,
+            **entry,
+        )
+        rkey = "replaced" if replace else "created"
+        if not r.get(rkey):
+            msg = f"Network ACL entry {entry['rule_number']} was not {rkey}."
+            ret["applied"] = False
+            ret["error"] = r.get("error", {"message": msg})
+            return ret
+        ret[rkey].append(entry["rule_number"])
+    return ret
+
+
 def delete_network_acl_entry(
     network_acl_id=None,
     rule_number=None,
@@ -3525,30 +3904,16 @@ def describe_route_tables(
         return {"error": __utils__["boto.get_error"](e)}
 
 
-def _create_dhcp_options(
-    conn,
-    domain_name=None,
-    domain_name_servers=None,
-    ntp_servers=None,
-    netbios_name_servers=None,
-    netbios_node_type=None,
-):
-    return conn.create_dhcp_options(
-        domain_name=domain_name,
-        domain_name_servers=domain_name_servers,
-        ntp_servers=ntp_servers,
-        netbios_name_servers=netbios_name_servers,
-        netbios_node_type=netbios_node_type,
-    )
-
-
 def _maybe_set_name_tag(name, obj):
     if name:
         obj.add_tag("Name", name)
         log.debug("%s is now named as %s", obj, name)
 
 
-def _maybe_set_tags(tags, obj):
+def _maybe_set_tags(tags, obj, name=None):
+    # Fold the Name tag in, so that both are set with a single CreateTags call
+    if name:
+        tags = {"Name": name, **(tags or {})}
     if tags:
         # Not all objects in Boto have an 'add_tags()' method.
         try:
@@ -19,6 +19,7 @@ import logging
 import os
 import re
 
+import salt.utils.atomicfile
 import salt.utils.data
 import salt.utils.files
 import salt.utils.path
@@ -29,6 +30,9 @@ log = logging.getLogger(__name__)
 # Define the module's virtual name
 __virtualname__ = "ports"
 
+_FETCH_COUNT_RE = re.compile(r"Fetching (\d+) (patches|new ports or files)")
+_OPTIONS_FILE_RE = re.compile(r"^OPTIONS_FILE_(UN)?SET\+=(\S+)$")
+
 
 def __virtual__():
     """
@@ -64,8 +68,12 @@ def _check_portname(name):
         )
 
     path = os.path.join("/usr/ports", name)
-    if not os.path.isdir(path):
-        raise SaltInvocationError("Path '{}' does not exist".format(path))
+    # Remember the ports we already found, ports.update clears this
+    known = __context__.setdefault("ports.known_portpaths", set())
+    if path not in known:
+        if not os.path.isdir(path):
+            raise SaltInvocationError("Path '{}' does not exist".format(path))
+        known.add(path)
 
     return path
 
@@ -101,36 +109,46 @@ def _write_options(name, configuration):
     """
     _check_portname(name)
 
-    pkg = next(iter(configuration))
-    conf_ptr = configuration[pkg]
+    pkg, conf_ptr = next(iter(configuration.items()))
 
     dirname = _options_dir(name)
-    if not os.path.isdir(dirname):
-        try:
-            os.makedirs(dirname)
-        except OSError as exc:
-            raise CommandExecutionError("Unable to make {}: {}".format(dirname, exc))
-
-    with salt.utils.files.fopen(os.path.join(dirname, "options"), "w") as fp_:
-        sorted_options = list(conf_ptr)
-        sorted_options.sort()
-        fp_.write(
-            salt.utils.stringutils.to_str(
-                "# This file was auto-generated by Salt (http://saltstack.com)\n"
-                "# Options for {0}\n"
-                "_OPTIONS_READ={0}\n"
-                "_FILE_COMPLETE_OPTIONS_LIST={1}\n".format(
-                    pkg, " ".join(sorted_options)
-                )
-            )
-        )
-        opt_tmpl = "OPTIONS_FILE_{0}SET+={1}\n"
-        for opt in sorted_options:
-            fp_.write(
-                salt.utils.stringutils.to_str(
-                    opt_tmpl.format("" if conf_ptr[opt] == "on" else "UN", opt)
-                )
-            )
+    try:
+        os.makedirs(dirname, exist_ok=True)
+    except OSError as exc:
+        raise CommandExecutionError("Unable to make {}: {}".format(dirname, exc))
+
+    sorted_options = sorted(conf_ptr)
+    opt_tmpl = "OPTIONS_FILE_{0}SET+={1}\n"
+    contents = (
+        "# This file was auto-generated by Salt (http://saltstack.com)\n"
+        "# Options for {0}\n"
+        "_OPTIONS_READ={0}\n"
+        "_FILE_COMPLETE_OPTIONS_LIST={1}\n".format(pkg, " ".join(sorted_options))
+    ) + "".join(
+        opt_tmpl.format("" if conf_ptr[opt] == "on" else "UN", opt)
+        for opt in sorted_options
+    )
+
+    # Replace the file atomically, so a concurrent 'make showconfig' never
+    # sees a partially written one
+    with salt.utils.atomicfile.atomic_open(
+        os.path.join(dirname, "options"), "w"
+    ) as fp_:
+        fp_.write(salt.utils.stringutils.to_str(contents))
+
+
+def _read_options(name):
+    """
+    Read back the OPTIONS file for a port, returning a dict of option names
+    mapped to ``on``/``off``
+    """
+    ret = {}
+    with salt.utils.files.fopen(os.path.join(_options_dir(name), "options")) as fp_:
+        for line in fp_:
+            match = _OPTIONS_FILE_RE.match(salt.utils.stringutils.to_unicode(line))
+            if match:
+                ret[match.group(2)] = "off" if match.group(1) else "on"
+    return ret
 
 
 def _normalize(val):
@@ -289,9 +307,13 @@ def showconfig(name, default=False, dict_return=False):
     ret = {pkg: {}}
     output = output[1:]
     for line in output:
-        try:
-            opt, val, desc = re.match(r"\s+([^=]+)=(off|on): (.+)", line).groups()
-        except AttributeError:
+        # Option lines look like "     IPV6=on: IPv6 protocol support"
+        stripped = line.lstrip()
+        if stripped == line:
+            continue
+        opt, eq, rest = stripped.partition("=")
+        val, sep, desc = rest.partition(": ")
+        if not (opt and eq and sep and desc) or val not in ("on", "off"):
             continue
         ret[pkg][opt] = val
 
@@ -332,12 +354,23 @@ def config(name, reset=False, **kwargs):
         )
 
     # Get top-level key for later reference
-    pkg = next(iter(configuration))
-    conf_ptr = configuration[pkg]
+    pkg, conf_ptr = next(iter(configuration.items()))
 
-    opts = {str(x): _normalize(kwargs[x]) for x in kwargs if not x.startswith("_")}
+    opts = {}
+    bad_opts = []
+    bad_vals = []
+    for key, val in kwargs.items():
+        if key.startswith("_"):
+            continue
+        key = str(key)
+        val = _normalize(val)
+        if key not in conf_ptr:
+            bad_opts.append(key)
+        elif val not in ("on", "off"):
+            bad_vals.append("{}={}".format(key, val))
+        else:
+            opts[key] = val
 
-    bad_opts = [x for x in opts if x not in conf_ptr]
     if bad_opts:
         raise SaltInvocationError(
             "The following opts are not valid for port {}: {}".format(
@@ -345,7 +378,6 @@ def config(name, reset=False, **kwargs):
             )
         )
 
-    bad_vals = ["{}={}".format(x, y) for x, y in opts.items() if y not in ("on", "off")]
     if bad_vals:
         raise SaltInvocationError(
             "The following key/value pairs are invalid: {}".format(", ".join(bad_vals))
@@ -354,10 +386,12 @@ def config(name, reset=False, **kwargs):
     conf_ptr.update(opts)
     _write_options(name, configuration)
 
-    new_config = showconfig(name, dict_return=True)
+    # Verify against the file just written rather than running another
+    # 'make showconfig'
     try:
-        new_config = new_config[next(iter(new_config))]
-    except (StopIteration, TypeError):
+        new_config = _read_options(name)
+    except OSError as exc:
+        log.error("Unable to read back options for %s: %s", name, exc)
         return False
 
     return all(conf_ptr[x] == new_config.get(x) for x in conf_ptr)
@@ -384,20 +418,15 @@ def update(extract=False):
         )
 
     ret = []
-    try:
-        patch_count = re.search(r"Fetching (\d+) patches", result["stdout"]).group(1)
-    except AttributeError:
-        patch_count = 0
-
-    try:
-        new_port_count = re.search(
-            r"Fetching (\d+) new ports or files", result["stdout"]
-        ).group(1)
-    except AttributeError:
-        new_port_count = 0
-
-    ret.append("Applied {} new patches".format(patch_count))
-    ret.append("Fetched {} new ports or files".format(new_port_count))
+    counts = {}
+    for match in _FETCH_COUNT_RE.finditer(result["stdout"]):
+        # only the first occurrence of each counts
+        counts.setdefault(match.group(2), match.group(1))
+
+    ret.append("Applied {} new patches".format(counts.get("patches", 0)))
+    ret.append(
+        "Fetched {} new ports or files".format(counts.get("new ports or files", 0))
+    )
 
     if extract:
         result = __salt__["cmd.run_all"](_portsnap() + ["extract"], python_shell=False)
@@ -413,6 +442,7 @@ def update(extract=False):
         )
 
     __context__.pop("ports.list_all", None)
+    __context__.pop("ports.known_portpaths", None)
     return "\n".join(ret)
 
 
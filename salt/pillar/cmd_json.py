@@ -14,15 +14,39 @@ Set the following Salt config to setup cmd json result as external pillar source
 
 This will run the command ``echo {arg: value}`` on the master.
 
+The string ``%s`` in the command is replaced with the id of the minion the
+pillar is compiled for. A command without ``%s`` returns the same data for
+every minion, so its output can be shared between pillar compiles for a
+number of seconds by setting ``cmd_json_cache_ttl`` in the master config
+(disabled by default). The output is kept in the ``pillar/cmd_json`` bank
+of the Salt cache:
+
+.. code-block:: yaml
+
+  cmd_json_cache_ttl: 60
+
 
 Module Documentation
 ====================
 
 """
 
+import copy
+import hashlib
 import logging
+import re
+import time
 
+import salt.cache
 import salt.utils.json
+import salt.utils.stringutils
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Don't "fix" the above docstring to put it on two lines, as the sphinx
 # autosummary pulls only the first line for its description.
@@ -31,6 +55,27 @@ import salt.utils.json
 # Set up logging
 log = logging.getLogger(__name__)
 
+# Salt cache bank for the output of minion-independent commands
+_CACHE_BANK = "pillar/cmd_json"
+
+# orjson turns integers outside of the 64 bit range into floats, so output
+# containing numbers this long is left to salt.utils.json
+_LONG_NUMBER_RE = re.compile(r"\d{19,}")
+
+
+def _loads(output):
+    """
+    Parse the command output, with orjson if it is installed. orjson rejects
+    or changes some input the json module accepts (NaN/Infinity, integers
+    beyond 64 bits), so fall back to salt.utils.json for those.
+    """
+    if HAS_ORJSON and not _LONG_NUMBER_RE.search(output):
+        try:
+            return orjson.loads(output)
+        except orjson.JSONDecodeError:
+            pass
+    return salt.utils.json.loads(output)
+
 
 def ext_pillar(
     minion_id, pillar, command  # pylint: disable=W0613  # pylint: disable=W0613
@@ -38,9 +83,28 @@ def ext_pillar(
     """
     Execute a command and read the output as JSON
     """
+    cache_ttl = __opts__.get("cmd_json_cache_ttl", 0)
+    cache = None
+    if cache_ttl > 0 and "%s" not in command:
+        # Every pillar compile runs in a new loader, so the output is kept in
+        # the Salt cache rather than in this module
+        cache = salt.cache.Cache(__opts__)
+        cache_key = hashlib.sha256(salt.utils.stringutils.to_bytes(command)).hexdigest()
+        cached = cache.fetch(_CACHE_BANK, cache_key)
+        if cached and 0 <= time.time() - cached["time"] < cache_ttl:
+            # the pillar merge may modify nested data in place
+            return copy.deepcopy(cached["data"])
+
     try:
         command = command.replace("%s", minion_id)
-        return salt.utils.json.loads(__salt__["cmd.run"](command))
+        output = __salt__["cmd.run"](command)
+        data = _loads(output)
     except Exception:  # pylint: disable=broad-except
         log.critical("JSON data from %s failed to parse", command)
         return {}
+
+    if cache is not None:
+        cache.store(
+            _CACHE_BANK, cache_key, {"time": time.time(), "data": copy.deepcopy(data)}
+        )
+    return data
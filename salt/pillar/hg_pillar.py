@@ -15,13 +15,19 @@ This external Pillar source can be configured in the master config file as such:
 
    ext_pillar:
      - hg: ssh://hg@example.co/user/repo
+
+Pillar compiles for different minions share a single ``hg pull`` of the
+repository for ``hg_pillar_pull_interval`` seconds (default: 60). Set it
+to ``0`` to pull on every compile. The time of the last pull is the mtime
+of ``<repo hash>.pull`` next to the clone in ``<cachedir>/hg_pillar``.
 """
-import copy
 import hashlib
 import logging
 import os
+import time
 
 import salt.pillar
+import salt.utils.files
 import salt.utils.stringutils
 from salt.config import DEFAULT_HASH_TYPE
 
@@ -68,7 +74,10 @@ def ext_pillar(minion_id, pillar, repo, branch="default", root=None):
     else:
         path = repo.working_dir
 
-    opts = copy.deepcopy(__opts__)
+    # Pillar() makes its own deep copy of the opts, only pillar_roots needs
+    # copying here so the override doesn't leak into __opts__
+    opts = __opts__.copy()
+    opts["pillar_roots"] = dict(__opts__.get("pillar_roots", {}))
     opts["pillar_roots"][envname] = [path]
     pil = salt.pillar.Pillar(opts, __grains__, minion_id, envname)
     return pil.compile_pillar(ext=False)
@@ -94,6 +103,9 @@ class Repo:
         hash_type = getattr(hashlib, __opts__.get("hash_type", DEFAULT_HASH_TYPE))
         repo_hash = hash_type(salt.utils.stringutils.to_bytes(repo_uri)).hexdigest()
         self.working_dir = os.path.join(cachedir, repo_hash)
+        # Each pillar compile runs in a new loader, so the time of the last
+        # pull is kept on disk instead of in the module
+        self.pull_stamp = f"{self.working_dir}.pull"
         if not os.path.isdir(self.working_dir):
             self.repo = hglib.clone(repo_uri, self.working_dir)
             self.repo.open()
@@ -103,13 +115,27 @@ class Repo:
     def pull(self):
         log.debug("Updating hg repo from hg_pillar module (pull)")
         self.repo.pull()
+        with salt.utils.files.fopen(self.pull_stamp, "w"):
+            pass
+
+    def pulled_within(self, interval):
+        """
+        Return True if the repo was pulled less than ``interval`` seconds ago
+        """
+        try:
+            age = time.time() - os.path.getmtime(self.pull_stamp)
+        except OSError:
+            return False
+        return 0 <= age < interval
 
     def update(self, branch="default"):
         """
         Ensure we are using the latest revision in the hg repository
         """
-        log.debug("Updating hg repo from hg_pillar module (pull)")
-        self.repo.pull()
+        if self.pulled_within(__opts__.get("hg_pillar_pull_interval", 60)):
+            log.debug("Skipping pull of hg repo %s, pulled recently", self.repo_uri)
+        else:
+            self.pull()
         log.debug("Updating hg repo from hg_pillar module (update)")
         self.repo.update(branch, clean=True)
 
@@ -373,7 +373,8 @@ def function_present(
 
 
 def _get_role_arn(name, region=None, key=None, keyid=None, profile=None):
-    if name.startswith("arn:aws:iam:"):
+    # Any ARN (including other partitions such as aws-cn) is taken as-is
+    if name.startswith("arn:"):
         return name
 
     account_id = __salt__["boto_iam.get_account_id"](
@@ -37,6 +37,26 @@ def __virtual__():
     return (False, "glusterfs module could not be loaded")
 
 
+def _cached(func):
+    """
+    Run a read-only glusterfs function (peer_status, list_volumes or info)
+    once per state run, the result is kept in __context__ until
+    _invalidate() is called after a change to the pool.
+    """
+    key = "glusterfs.state.{}".format(func)
+    if key not in __context__:
+        __context__[key] = __salt__["glusterfs.{}".format(func)]()
+    return __context__[key]
+
+
+def _invalidate():
+    """
+    Drop the results cached by _cached()
+    """
+    for func in ("peer_status", "list_volumes", "info"):
+        __context__.pop("glusterfs.state.{}".format(func), None)
+
+
 def peered(name):
     """
     Check if node is peered.
@@ -66,6 +86,12 @@ def peered(name):
         ret["comment"] = "Invalid characters in peer name."
         return ret
 
+    # This minion's own host name needs neither a DNS lookup nor the peer list
+    if name in (__grains__.get("host"), __grains__.get("fqdn")):
+        ret["result"] = True
+        ret["comment"] = "Peering with localhost is not needed"
+        return ret
+
     # Check if the name resolves to one of this minion IP addresses
     name_ips = salt.utils.network.host_to_ips(name)
     if name_ips is not None:
@@ -80,7 +106,7 @@ def peered(name):
             ret["comment"] = "Peering with localhost is not needed"
             return ret
 
-    peers = __salt__["glusterfs.peer_status"]()
+    peers = _cached("peer_status")
 
     if peers and any(name in v["hostnames"] for v in peers.values()):
         ret["result"] = True
@@ -92,14 +118,16 @@ def peered(name):
         ret["result"] = None
         return ret
 
-    if not __salt__["glusterfs.peer"](name):
+    peer_added = __salt__["glusterfs.peer"](name)
+    _invalidate()
+    if not peer_added:
         ret["comment"] = "Failed to peer with {}, please check logs for errors".format(
             name
         )
         return ret
 
     # Double check that the action succeeded
-    newpeers = __salt__["glusterfs.peer_status"]()
+    newpeers = _cached("peer_status")
     if newpeers and any(name in v["hostnames"] for v in newpeers.values()):
         ret["result"] = True
         ret["comment"] = "Host {} successfully peered".format(name)
@@ -179,7 +207,7 @@ def volume_present(
         ret["comment"] = "Invalid characters in volume name."
         return ret
 
-    volumes = __salt__["glusterfs.list_volumes"]()
+    volumes = _cached("list_volumes")
     if name not in volumes:
         if __opts__["test"]:
             comment = "Volume {} will be created".format(name)
@@ -192,12 +220,13 @@ def volume_present(
         vol_created = __salt__["glusterfs.create_volume"](
             name, bricks, stripe, replica, device_vg, transport, start, force, arbiter
         )
+        _invalidate()
 
         if not vol_created:
             ret["comment"] = "Creation of volume {} failed".format(name)
             return ret
         old_volumes = volumes
-        volumes = __salt__["glusterfs.list_volumes"]()
+        volumes = _cached("list_volumes")
         if name in volumes:
             ret["changes"] = {"new": volumes, "old": old_volumes}
             ret["comment"] = "Volume {} is created".format(name)
@@ -211,11 +240,12 @@ def volume_present(
             ret["comment"] = ret["comment"] + " and will be started"
             ret["result"] = None
             return ret
-        if int(__salt__["glusterfs.info"]()[name]["status"]) == 1:
+        if int(_cached("info")[name]["status"]) == 1:
             ret["result"] = True
             ret["comment"] = ret["comment"] + " and is started"
         else:
             vol_started = __salt__["glusterfs.start_volume"](name)
+            _invalidate()
             if vol_started:
                 ret["result"] = True
                 ret["comment"] = ret["comment"] + " and is now started"
@@ -249,7 +279,7 @@ def started(name):
     """
     ret = {"name": name, "changes": {}, "comment": "", "result": False}
 
-    volinfo = __salt__["glusterfs.info"]()
+    volinfo = _cached("info")
     if name not in volinfo:
         ret["result"] = False
         ret["comment"] = "Volume {} does not exist".format(name)
@@ -265,6 +295,7 @@ def started(name):
         return ret
 
     vol_started = __salt__["glusterfs.start_volume"](name)
+    _invalidate()
     if vol_started:
         ret["result"] = True
         ret["comment"] = "Volume {} is started".format(name)
@@ -303,7 +334,7 @@ def add_volume_bricks(name, bricks):
     """
     ret = {"name": name, "changes": {}, "comment": "", "result": False}
 
-    volinfo = __salt__["glusterfs.info"]()
+    volinfo = _cached("info")
     if name not in volinfo:
         ret["comment"] = "Volume {} does not exist".format(name)
         return ret
@@ -319,12 +350,12 @@ def add_volume_bricks(name, bricks):
         return ret
 
     bricks_added = __salt__["glusterfs.add_volume_bricks"](name, bricks)
+    _invalidate()
     if bricks_added:
         ret["result"] = True
         ret["comment"] = "Bricks successfully added to volume {}".format(name)
         new_bricks = [
-            brick["path"]
-            for brick in __salt__["glusterfs.info"]()[name]["bricks"].values()
+            brick["path"] for brick in _cached("info")[name]["bricks"].values()
         ]
         ret["changes"] = {"new": new_bricks, "old": current_bricks}
         return ret
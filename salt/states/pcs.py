@@ -167,6 +167,9 @@ Create a cluster from scratch:
 .. versionadded:: 2016.3.0
 """
 
+import contextlib
+import filecmp
+import hashlib
 import logging
 import os
 
@@ -176,6 +179,11 @@ import salt.utils.stringutils
 
 log = logging.getLogger(__name__)
 
+# Per-node states reported by pcs for successful operations
+_AUTH_OK = frozenset(("Already authorized", "Authorized"))
+_SETUP_OK = frozenset(("Succeeded", "Success", "Cluster enabled"))
+_NODE_ADD_OK = frozenset(("Succeeded", "Success"))
+
 
 def __virtual__():
     """
@@ -194,17 +202,65 @@ def _file_read(path):
     if os.path.exists(path):
         with salt.utils.files.fopen(path, "r+") as fp_:
             content = salt.utils.stringutils.to_unicode(fp_.read())
-        fp_.close()
     return content
 
 
 def _file_write(path, content):
     """
-    Write content to a file
+    Write content to a file. The content goes to a temporary file first,
+    which then replaces the target, so a crash never leaves a partial file.
     """
-    with salt.utils.files.fopen(path, "w+") as fp_:
+    path_tmp = f"{path}.tmp"
+    with salt.utils.files.fopen(path_tmp, "w") as fp_:
         fp_.write(salt.utils.stringutils.to_str(content))
-    fp_.close()
+        fp_.flush()
+        os.fsync(fp_.fileno())
+    os.replace(path_tmp, path)
+
+
+def _split_key_value(line):
+    """
+    Split a 'key: value' line of pcs output into its stripped key and value.
+    Returns (None, None) unless the line contains exactly one colon.
+    """
+    key, sep, value = line.partition(":")
+    if not sep or ":" in value:
+        return None, None
+    return key.strip(), value.strip()
+
+
+def _parse_node_states(output, nodes):
+    """
+    Map each of the given nodes to its state from the 'node: state' lines of
+    pcs output. Nodes which are not mentioned in the output are left out.
+    """
+    nodes = set(nodes)
+    return {
+        node: state
+        for node, state in map(_split_key_value, output.splitlines())
+        if node in nodes
+    }
+
+
+def _item_show(item, item_id, item_type, show, cibfile):
+    """
+    Run pcs.item_show. Without an item id the output covers every item of
+    its kind, so it is kept in __context__ and shared between the states of
+    a run until one of them creates an item, sets up the cluster, or replaces
+    or pushes a CIB.
+    """
+    if item_id is not None:
+        return __salt__["pcs.item_show"](
+            item=item, item_id=item_id, item_type=item_type, show=show, cibfile=cibfile
+        )
+
+    cache = __context__.setdefault("pcs.item_show", {})
+    key = (item, item_type, show, cibfile)
+    if key not in cache:
+        cache[key] = __salt__["pcs.item_show"](
+            item=item, item_id=None, item_type=item_type, show=show, cibfile=cibfile
+        )
+    return cache[key]
 
 
 def _get_cibpath():
@@ -220,7 +276,7 @@ def _get_cibfile(cibname):
     """
     Get the full path of a cached CIB-file with the name of the CIB
     """
-    cibfile = os.path.join(_get_cibpath(), "{}.{}".format(cibname, "cib"))
+    cibfile = os.path.join(_get_cibpath(), f"{cibname}.cib")
     log.trace("cibfile: %s", cibfile)
     return cibfile
 
@@ -243,13 +299,70 @@ def _get_cibfile_cksum(cibname):
     return cibfile_cksum
 
 
+def _get_cibfile_stat(cibname):
+    """
+    Get the full path of the file recording the stat of a CIB-file at the
+    time its checksum was written
+    """
+    cibfile_stat = f"{_get_cibfile(cibname)}.stat"
+    log.trace("cibfile_stat: %s", cibfile_stat)
+    return cibfile_stat
+
+
+def _cib_stat(cibfile):
+    """
+    Identify the current version of a CIB-file by inode, mtime, ctime and
+    size. The ctime also changes when the mtime is reset (``cp -p``,
+    ``touch -r``).
+    """
+    stat = os.stat(cibfile)
+    return f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_ctime_ns}:{stat.st_size}"
+
+
+def _cib_stat_unchanged(cibfile, cibfile_stat):
+    """
+    Check whether a CIB-file is unchanged since its stat was recorded.
+
+    The recorded stat is only trusted if the CIB-file last changed (its
+    ctime, which any modification updates) before the stat file was written.
+    Otherwise a later change within the same timestamp tick could keep the
+    same timestamps and go unnoticed.
+    """
+    try:
+        recorded_mtime_ns = os.stat(cibfile_stat).st_mtime_ns
+    except OSError:
+        return False
+    if os.stat(cibfile).st_ctime_ns >= recorded_mtime_ns:
+        return False
+    return _file_read(cibfile_stat) == _cib_stat(cibfile)
+
+
+def _record_cib_stat(cibfile, cibfile_stat):
+    """
+    Record the stat of a CIB-file which matches its checksum, so cib_pushed
+    can tell it is unchanged without hashing it again
+    """
+    if _cib_stat_unchanged(cibfile, cibfile_stat):
+        return
+    cib_stat = _cib_stat(cibfile)
+    try:
+        _file_write(cibfile_stat, cib_stat)
+    except OSError as exc:
+        log.debug("Failed to record the stat of %s: %s", cibfile, exc)
+
+
 def _get_node_list_for_version(nodes):
     """
     PCS with version < 0.10 returns lowercase hostnames. Newer versions return the proper hostnames.
     This accomodates for the old functionality.
     """
-    pcs_version = __salt__["pkg.version"]("pcs")
-    if __salt__["pkg.version_cmp"](pcs_version, "0.10") == -1:
+    # The installed pcs version is looked up once per state run
+    if "pcs.is_old_version" not in __context__:
+        pcs_version = __salt__["pkg.version"]("pcs")
+        __context__["pcs.is_old_version"] = (
+            __salt__["pkg.version_cmp"](pcs_version, "0.10") == -1
+        )
+    if __context__["pcs.is_old_version"]:
         log.info("Node list converted to lower case for backward compatibility")
         nodes_for_version = [x.lower() for x in nodes]
     else:
@@ -301,17 +414,18 @@ def _item_present(
     item_id_key = item_id
     item_id_value = None
     if "=" in item_id:
-        item_id_key = item_id.split("=")[0].strip()
-        item_id_value = item_id.replace(item_id.split("=")[0] + "=", "").strip()
+        item_id_key, _, item_id_value = item_id.partition("=")
+        item_id_key = item_id_key.strip()
+        item_id_value = item_id_value.strip()
         log.trace("item_id_key=%s item_id_value=%s", item_id_key, item_id_value)
 
     # constraints, properties, resource defaults or resource op defaults
     # do not support specifying an id on 'show' command
     item_id_show = item_id
-    if item in ["constraint"] or "=" in item_id:
+    if item == "constraint" or "=" in item_id:
         item_id_show = None
 
-    is_existing = __salt__["pcs.item_show"](
+    is_existing = _item_show(
         item=item, item_id=item_id_show, item_type=item_type, show=show, cibfile=cibfile
     )
     log.trace(
@@ -325,37 +439,30 @@ def _item_present(
 
     # key,value pairs (item_id contains =) - match key and value
     if item_id_value is not None:
-        for line in is_existing["stdout"].splitlines():
-            if len(line.split(":")) in [2]:
-                key = line.split(":")[0].strip()
-                value = line.split(":")[1].strip()
-                if item_id_key in [key]:
-                    if item_id_value in [value]:
-                        item_create_required = False
+        if any(
+            _split_key_value(line) == (item_id_key, item_id_value)
+            for line in is_existing["stdout"].splitlines()
+        ):
+            item_create_required = False
 
     # constraints match on '(id:<id>)'
-    elif item in ["constraint"]:
-        for line in is_existing["stdout"].splitlines():
-            if f"(id:{item_id})" in line:
-                item_create_required = False
+    elif item == "constraint":
+        if f"(id:{item_id})" in is_existing["stdout"]:
+            item_create_required = False
 
     # item_id was provided,
     # return code 0 indicates, that resource already exists
     else:
-        if is_existing["retcode"] in [0]:
+        if is_existing["retcode"] == 0:
             item_create_required = False
 
     if not item_create_required:
-        ret["comment"] += "{} {} ({}) is already existing\n".format(
-            str(item), str(item_id), str(item_type)
-        )
+        ret["comment"] += f"{item} {item_id} ({item_type}) is already existing\n"
         return ret
 
     if __opts__["test"]:
         ret["result"] = None
-        ret["comment"] += "{} {} ({}) is set to be created\n".format(
-            str(item), str(item_id), str(item_type)
-        )
+        ret["comment"] += f"{item} {item_id} ({item_type}) is set to be created\n"
         return ret
 
     item_create = __salt__["pcs.item_create"](
@@ -367,16 +474,15 @@ def _item_present(
         cibfile=cibfile,
     )
 
+    __context__.pop("pcs.item_show", None)
     log.trace("Output of pcs.item_create: %s", item_create)
 
-    if item_create["retcode"] in [0]:
+    if item_create["retcode"] == 0:
         ret["comment"] += f"Created {item} {item_id} ({item_type})\n"
         ret["changes"].update({item_id: {"old": "", "new": str(item_id)}})
     else:
         ret["result"] = False
-        ret["comment"] += "Failed to create {} {} ({})\n".format(
-            item, item_id, item_type
-        )
+        ret["comment"] += f"Failed to create {item} {item_id} ({item_type})\n"
 
     log.trace("ret: %s", ret)
 
@@ -417,24 +523,35 @@ def auth(name, nodes, pcsuser="hacluster", pcspasswd="hacluster", extra_args=Non
 
     nodes = _get_node_list_for_version(nodes)
 
-    authorized = __salt__["pcs.is_auth"](
-        nodes=nodes, pcsuser=pcsuser, pcspasswd=pcspasswd
+    # The authorization check runs a round trip to every node, so reuse its
+    # result for further auth states of the same nodes and credentials in
+    # this run. Only a hash of the password is kept.
+    is_auth_cache = __context__.setdefault("pcs.is_auth", {})
+    is_auth_key = (
+        frozenset(nodes),
+        pcsuser,
+        hashlib.sha256(salt.utils.stringutils.to_bytes(pcspasswd)).hexdigest(),
     )
+    if is_auth_key not in is_auth_cache:
+        is_auth_cache[is_auth_key] = __salt__["pcs.is_auth"](
+            nodes=nodes, pcsuser=pcsuser, pcspasswd=pcspasswd
+        )
+    authorized = is_auth_cache[is_auth_key]
     log.trace("Output of pcs.is_auth: %s", authorized)
 
+    # Failed nodes report an error containing further colons, so only split
+    # at the first one here
+    node_set = set(nodes)
     authorized_dict = {}
     for line in authorized["stdout"].splitlines():
-        node = line.split(":")[0].strip()
-        auth_state = line.split(":")[1].strip()
-        if node in nodes:
-            authorized_dict.update({node: auth_state})
+        node, _, auth_state = line.partition(":")
+        node = node.strip()
+        if node in node_set:
+            authorized_dict[node] = auth_state.strip()
     log.trace("authorized_dict: %s", authorized_dict)
 
     for node in nodes:
-        if node in authorized_dict and (
-            authorized_dict[node] == "Already authorized"
-            or authorized_dict[node] == "Authorized"
-        ):
+        if authorized_dict.get(node) in _AUTH_OK:
             ret["comment"] += f"Node {node} is already authorized\n"
         else:
             auth_required = True
@@ -451,18 +568,19 @@ def auth(name, nodes, pcsuser="hacluster", pcspasswd="hacluster", extra_args=Non
     authorize = __salt__["pcs.auth"](
         nodes=nodes, pcsuser=pcsuser, pcspasswd=pcspasswd, extra_args=extra_args
     )
+    is_auth_cache.clear()
     log.trace("Output of pcs.auth: %s", authorize)
 
     authorize_dict = {}
     for line in authorize["stdout"].splitlines():
-        node = line.split(":")[0].strip()
-        auth_state = line.split(":")[1].strip()
-        if node in nodes:
-            authorize_dict.update({node: auth_state})
+        node, _, auth_state = line.partition(":")
+        node = node.strip()
+        if node in node_set:
+            authorize_dict[node] = auth_state.strip()
     log.trace("authorize_dict: %s", authorize_dict)
 
     for node in nodes:
-        if node in authorize_dict and authorize_dict[node] == "Authorized":
+        if authorize_dict.get(node) == "Authorized":
             ret["comment"] += f"Authorized {node}\n"
             ret["changes"].update({node: {"old": "", "new": "Authorized"}})
         else:
@@ -470,13 +588,11 @@ def auth(name, nodes, pcsuser="hacluster", pcspasswd="hacluster", extra_args=Non
             if node in authorized_dict:
                 ret[
                     "comment"
-                ] += "Authorization check for node {} returned: {}\n".format(
-                    node, authorized_dict[node]
-                )
+                ] += f"Authorization check for node {node} returned: {authorized_dict[node]}\n"
             if node in authorize_dict:
-                ret["comment"] += "Failed to authorize {} with error {}\n".format(
-                    node, authorize_dict[node]
-                )
+                ret[
+                    "comment"
+                ] += f"Failed to authorize {node} with error {authorize_dict[node]}\n"
 
     return ret
 
@@ -541,20 +657,15 @@ def cluster_setup(
     log.trace("Output of pcs.config_show: %s", config_show)
 
     for line in config_show["stdout"].splitlines():
-        if len(line.split(":")) in [2]:
-            key = line.split(":")[0].strip()
-            value = line.split(":")[1].strip()
-            if key in ["Cluster Name"]:
-                if value in [pcsclustername]:
-                    ret["comment"] += "Cluster {} is already set up\n".format(
-                        pcsclustername
-                    )
+        key, value = _split_key_value(line)
+        if key is not None:
+            if key == "Cluster Name":
+                if value == pcsclustername:
+                    ret["comment"] += f"Cluster {pcsclustername} is already set up\n"
                 else:
                     setup_required = True
                     if __opts__["test"]:
-                        ret["comment"] += "Cluster {} is set to set up\n".format(
-                            pcsclustername
-                        )
+                        ret["comment"] += f"Cluster {pcsclustername} is set to set up\n"
 
     if not setup_required:
         log.info("No setup required")
@@ -584,26 +695,15 @@ def cluster_setup(
     setup = __salt__["pcs.cluster_setup"](
         nodes=nodes, pcsclustername=pcsclustername, extra_args=extra_args
     )
+    __context__.pop("pcs.status_nodes_corosync", None)
+    __context__.pop("pcs.item_show", None)
     log.trace("Output of pcs.cluster_setup: %s", setup)
 
-    setup_dict = {}
-    for line in setup["stdout"].splitlines():
-        log.trace("line: %s", line)
-        log.trace("line.split(:).len: %s", len(line.split(":")))
-        if len(line.split(":")) in [2]:
-            node = line.split(":")[0].strip()
-            setup_state = line.split(":")[1].strip()
-            if node in nodes:
-                setup_dict.update({node: setup_state})
-
+    setup_dict = _parse_node_states(setup["stdout"], nodes)
     log.trace("setup_dict: %s", setup_dict)
 
     for node in nodes:
-        if node in setup_dict and setup_dict[node] in [
-            "Succeeded",
-            "Success",
-            "Cluster enabled",
-        ]:
+        if setup_dict.get(node) in _SETUP_OK:
             ret["comment"] += f"Set up {node}\n"
             ret["changes"].update({node: {"old": "", "new": "Setup"}})
         else:
@@ -648,25 +748,29 @@ def cluster_node_present(name, node, extra_args=None):
     node_add_required = True
     current_nodes = []
 
-    is_member_cmd = ["pcs", "status", "nodes", "corosync"]
-    is_member = __salt__["cmd.run_all"](
-        is_member_cmd, output_loglevel="trace", python_shell=False
-    )
+    # Several cluster_node_present states in one run share the membership
+    # check, until one of them changes the membership
+    if "pcs.status_nodes_corosync" not in __context__:
+        is_member_cmd = ["pcs", "status", "nodes", "corosync"]
+        __context__["pcs.status_nodes_corosync"] = __salt__["cmd.run_all"](
+            is_member_cmd, output_loglevel="trace", python_shell=False
+        )
+    is_member = __context__["pcs.status_nodes_corosync"]
     log.trace("Output of pcs status nodes corosync: %s", is_member)
 
     for line in is_member["stdout"].splitlines():
-        if len(line.split(":")) in [2]:
-            key = line.split(":")[0].strip()
-            value = line.split(":")[1].strip()
-            if key in ["Offline", "Online"]:
-                if len(value.split()) > 0:
-                    if node in value.split():
+        key, value = _split_key_value(line)
+        if key is not None:
+            if key in ("Offline", "Online"):
+                members = value.split()
+                if members:
+                    if node in members:
                         node_add_required = False
                         ret[
                             "comment"
                         ] += f"Node {node} is already member of the cluster\n"
                     else:
-                        current_nodes += value.split()
+                        current_nodes.extend(members)
 
     if not node_add_required:
         return ret
@@ -680,45 +784,34 @@ def cluster_node_present(name, node, extra_args=None):
         extra_args = []
 
     node_add = __salt__["pcs.cluster_node_add"](node=node, extra_args=extra_args)
+    __context__.pop("pcs.status_nodes_corosync", None)
     log.trace("Output of pcs.cluster_node_add: %s", node_add)
 
-    node_add_dict = {}
-    for line in node_add["stdout"].splitlines():
-        log.trace("line: %s", line)
-        log.trace("line.split(:).len: %s", len(line.split(":")))
-        if len(line.split(":")) in [2]:
-            current_node = line.split(":")[0].strip()
-            current_node_add_state = line.split(":")[1].strip()
-            if current_node in current_nodes + [node]:
-                node_add_dict.update({current_node: current_node_add_state})
+    node_add_dict = _parse_node_states(node_add["stdout"], current_nodes + [node])
     log.trace("node_add_dict: %s", node_add_dict)
 
     for current_node in current_nodes:
         if current_node in node_add_dict:
-            if node_add_dict[current_node] not in ["Corosync updated"]:
+            if node_add_dict[current_node] != "Corosync updated":
                 ret["result"] = False
-                ret["comment"] += "Failed to update corosync.conf on node {}\n".format(
-                    current_node
-                )
-                ret["comment"] += "{}: node_add_dict: {}\n".format(
-                    current_node, node_add_dict[current_node]
-                )
+                ret[
+                    "comment"
+                ] += f"Failed to update corosync.conf on node {current_node}\n"
+                ret[
+                    "comment"
+                ] += f"{current_node}: node_add_dict: {node_add_dict[current_node]}\n"
         else:
             ret["result"] = False
-            ret["comment"] += "Failed to update corosync.conf on node {}\n".format(
-                current_node
-            )
+            ret["comment"] += f"Failed to update corosync.conf on node {current_node}\n"
 
-    if node in node_add_dict and node_add_dict[node] in ["Succeeded", "Success"]:
+    if node_add_dict.get(node) in _NODE_ADD_OK:
         ret["comment"] += f"Added node {node}\n"
         ret["changes"].update({node: {"old": "", "new": "Added"}})
     else:
         ret["result"] = False
         ret["comment"] += f"Failed to add node{node}\n"
         if node in node_add_dict:
-            ret["comment"] += "{}: node_add_dict: {}\n".format(
-                node, node_add_dict[node]
-            )
+            ret["comment"] += f"{node}: node_add_dict: {node_add_dict[node]}\n"
         ret["comment"] += str(node_add)
 
     log.trace("ret: %s", ret)
@@ -730,6 +823,10 @@ def cib_present(name, cibname, scope=None, extra_args=None):
     """
     Ensure that a CIB-file with the content of the current live CIB is created
 
+    Next to the CIB-file a checksum of it (``<cibname>.cib.cksum``) and its
+    inode, mtime, ctime and size (``<cibname>.cib.stat``) are stored, which
+    pcs.cib_pushed uses to detect changes to the CIB-file.
+
     Should be run on one cluster node only
     (there may be races)
 
@@ -764,6 +861,7 @@ def cib_present(name, cibname, scope=None, extra_args=None):
     cibfile = _get_cibfile(cibname)
     cibfile_tmp = _get_cibfile_tmp(cibname)
     cibfile_cksum = _get_cibfile_cksum(cibname)
+    cibfile_stat = _get_cibfile_stat(cibname)
 
     if not os.path.exists(cibpath):
         os.makedirs(cibpath)
@@ -771,33 +869,34 @@ def cib_present(name, cibname, scope=None, extra_args=None):
     if not isinstance(extra_args, (list, tuple)):
         extra_args = []
 
-    if os.path.exists(cibfile_tmp):
-        __salt__["file.remove"](cibfile_tmp)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(cibfile_tmp)
 
     cib_create = __salt__["pcs.cib_create"](
         cibfile=cibfile_tmp, scope=scope, extra_args=extra_args
     )
     log.trace("Output of pcs.cib_create: %s", cib_create)
 
-    if cib_create["retcode"] not in [0] or not os.path.exists(cibfile_tmp):
+    if cib_create["retcode"] != 0 or not os.path.exists(cibfile_tmp):
         ret["result"] = False
         ret["comment"] += "Failed to get live CIB\n"
         return ret
 
-    cib_hash_live = "{}:{}".format(
-        cib_hash_form, __salt__["file.get_hash"](path=cibfile_tmp, form=cib_hash_form)
-    )
+    cib_hash = __salt__["file.get_hash"](path=cibfile_tmp, form=cib_hash_form)
+    cib_hash_live = f"{cib_hash_form}:{cib_hash}"
     log.trace("cib_hash_live: %s", cib_hash_live)
 
     cib_hash_cur = _file_read(path=cibfile_cksum)
 
-    if cib_hash_cur not in [cib_hash_live]:
+    if cib_hash_cur != cib_hash_live:
         cib_cksum_required = True
 
     log.trace("cib_hash_cur: %s", cib_hash_cur)
 
-    if not os.path.exists(cibfile) or not __salt__["file.check_hash"](
-        path=cibfile, file_hash=cib_hash_live
+    # Compare the cached CIB with the live one byte by byte, which stops at
+    # the first difference instead of hashing the whole file a second time
+    if not os.path.exists(cibfile) or not filecmp.cmp(
+        cibfile, cibfile_tmp, shallow=False
     ):
         cib_create_required = True
 
@@ -805,49 +904,56 @@ def cib_present(name, cibname, scope=None, extra_args=None):
         cib_required = True
 
     if not cib_create_required:
-        __salt__["file.remove"](cibfile_tmp)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(cibfile_tmp)
         ret["comment"] += f"CIB {cibname} is already equal to the live CIB\n"
 
     if not cib_cksum_required:
         ret["comment"] += f"CIB {cibname} checksum is correct\n"
 
     if not cib_required:
+        _record_cib_stat(cibfile, cibfile_stat)
         return ret
 
     if __opts__["test"]:
-        __salt__["file.remove"](cibfile_tmp)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(cibfile_tmp)
         ret["result"] = None
         if cib_create_required:
             ret["comment"] += f"CIB {cibname} is set to be created/updated\n"
         if cib_cksum_required:
-            ret["comment"] += "CIB {} checksum is set to be created/updated\n".format(
-                cibname
-            )
+            ret["comment"] += f"CIB {cibname} checksum is set to be created/updated\n"
         return ret
 
     if cib_create_required:
-        __salt__["file.move"](cibfile_tmp, cibfile)
-
-        if __salt__["file.check_hash"](path=cibfile, file_hash=cib_hash_live):
+        # The rename either succeeds or raises, so there is no need to hash
+        # the file again afterwards
+        __context__.pop("pcs.item_show", None)
+        try:
+            os.replace(cibfile_tmp, cibfile)
+        except OSError as exc:
+            ret["result"] = False
+            ret["comment"] += f"Failed to create/update CIB {cibname}: {exc}\n"
+        else:
             ret["comment"] += f"Created/updated CIB {cibname}\n"
             ret["changes"].update({"cibfile": cibfile})
-        else:
-            ret["result"] = False
-            ret["comment"] += f"Failed to create/update CIB {cibname}\n"
 
     if cib_cksum_required:
-        _file_write(cibfile_cksum, cib_hash_live)
-
-        if _file_read(cibfile_cksum) in [cib_hash_live]:
-            ret["comment"] += "Created/updated checksum {} of CIB {}\n".format(
-                cib_hash_live, cibname
-            )
-            ret["changes"].update({"cibcksum": cib_hash_live})
-        else:
+        try:
+            _file_write(cibfile_cksum, cib_hash_live)
+        except OSError as exc:
             ret["result"] = False
-            ret["comment"] += "Failed to create/update checksum {} CIB {}\n".format(
-                cib_hash_live, cibname
-            )
+            ret[
+                "comment"
+            ] += f"Failed to create/update checksum {cib_hash_live} CIB {cibname}: {exc}\n"
+        else:
+            ret[
+                "comment"
+            ] += f"Created/updated checksum {cib_hash_live} of CIB {cibname}\n"
+            ret["changes"].update({"cibcksum": cib_hash_live})
+
+    if ret["result"]:
+        _record_cib_stat(cibfile, cibfile_stat)
 
     log.trace("ret: %s", ret)
 
@@ -888,6 +994,7 @@ def cib_pushed(name, cibname, scope=None, extra_args=None):
 
     cibfile = _get_cibfile(cibname)
     cibfile_cksum = _get_cibfile_cksum(cibname)
+    cibfile_stat = _get_cibfile_stat(cibname)
 
     if not isinstance(extra_args, (list, tuple)):
         extra_args = []
@@ -897,35 +1004,34 @@ def cib_pushed(name, cibname, scope=None, extra_args=None):
         ret["comment"] += f"CIB-file {cibfile} does not exist\n"
         return ret
 
-    cib_hash_cibfile = "{}:{}".format(
-        cib_hash_form, __salt__["file.get_hash"](path=cibfile, form=cib_hash_form)
-    )
-    log.trace("cib_hash_cibfile: %s", cib_hash_cibfile)
+    # A CIB-file which was not touched since pcs.cib_present wrote its
+    # checksum still matches it, so only hash it when its stat changed
+    if not _cib_stat_unchanged(cibfile, cibfile_stat):
+        cib_hash = __salt__["file.get_hash"](path=cibfile, form=cib_hash_form)
+        cib_hash_cibfile = f"{cib_hash_form}:{cib_hash}"
+        log.trace("cib_hash_cibfile: %s", cib_hash_cibfile)
 
-    if _file_read(cibfile_cksum) not in [cib_hash_cibfile]:
-        cib_push_required = True
+        if _file_read(cibfile_cksum) != cib_hash_cibfile:
+            cib_push_required = True
 
     if not cib_push_required:
         ret[
             "comment"
-        ] += "CIB {} is not changed since creation through pcs.cib_present\n".format(
-            cibname
-        )
+        ] += f"CIB {cibname} is not changed since creation through pcs.cib_present\n"
         return ret
 
     if __opts__["test"]:
         ret["result"] = None
-        ret["comment"] += "CIB {} is set to be pushed as the new live CIB\n".format(
-            cibname
-        )
+        ret["comment"] += f"CIB {cibname} is set to be pushed as the new live CIB\n"
         return ret
 
     cib_push = __salt__["pcs.cib_push"](
         cibfile=cibfile, scope=scope, extra_args=extra_args
     )
+    __context__.pop("pcs.item_show", None)
     log.trace("Output of pcs.cib_push: %s", cib_push)
 
-    if cib_push["retcode"] in [0]:
+    if cib_push["retcode"] == 0:
         ret["comment"] += f"Pushed CIB {cibname}\n"
         ret["changes"].update({"cibfile_pushed": cibfile})
     else:
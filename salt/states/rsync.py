@@ -51,12 +51,10 @@ def _get_summary(rsync_out):
     Get summary from the rsync successful output.
     """
 
+    # The summary is the last block of the output
+    summary = rsync_out.rpartition("\n\n")[2]
     return "- " + "\n- ".join(
-        [
-            elm
-            for elm in rsync_out.split("\n\n")[-1].replace("  ", "\n").split("\n")
-            if elm
-        ]
+        [elm for elm in summary.replace("  ", "\n").split("\n") if elm]
     )
 
 
@@ -67,15 +65,18 @@ def _get_changes(rsync_out):
     copied = list()
     deleted = list()
 
-    for line in rsync_out.split("\n\n")[0].split("\n")[1:]:
+    # The file list is the first block of the output, after its header line
+    for line in rsync_out.partition("\n\n")[0].split("\n")[1:]:
         if line.startswith("deleting "):
             deleted.append(line.split(" ", 1)[-1])
         else:
             copied.append(line)
 
+    copied.sort()
+    deleted.sort()
     ret = {
-        "copied": os.linesep.join(sorted(copied)) or "N/A",
-        "deleted": os.linesep.join(sorted(deleted)) or "N/A",
+        "copied": os.linesep.join(copied) or "N/A",
+        "deleted": os.linesep.join(deleted) or "N/A",
     }
 
     # Return whether anything really changed
@@ -96,6 +97,8 @@ def synchronized(
     prepare=False,
     dryrun=False,
     additional_opts=None,
+    whole_file=False,
+    inplace=False,
 ):
     """
     Guarantees that the source directory is always copied to the target.
@@ -137,6 +140,14 @@ def synchronized(
         Pass additional options to rsync, should be included as a list.
 
         .. versionadded:: 2018.3.0
+
+    whole_file
+        Copy changed files whole instead of computing deltas (True or False).
+        Faster when the destination is empty or the network is fast.
+
+    inplace
+        Update destination files in place instead of writing a temporary
+        copy and renaming it (True or False)
     """
 
     ret = {"name": name, "changes": {}, "result": True, "comment": ""}
@@ -151,6 +162,13 @@ def synchronized(
         if __opts__["test"]:
             dryrun = True
 
+        if whole_file or inplace:
+            additional_opts = list(additional_opts or [])
+            if whole_file:
+                additional_opts.append("--whole-file")
+            if inplace:
+                additional_opts.append("--inplace")
+
         result = __salt__["rsync.rsync"](
             source,
             name,
@@ -173,13 +191,13 @@ def synchronized(
         if result.get("retcode"):
             ret["result"] = False
             ret["comment"] = result["stderr"]
-        # Changed
-        elif _get_changes(result["stdout"])["changed"]:
-            ret["comment"] = _get_summary(result["stdout"])
-            ret["changes"] = _get_changes(result["stdout"])
-            del ret["changes"]["changed"]  # Don't need to print the boolean
-        # Clean
         else:
+            changes = _get_changes(result["stdout"])
             ret["comment"] = _get_summary(result["stdout"])
-            ret["changes"] = {}
+            # Changed
+            if changes.pop("changed"):  # Don't need to print the boolean
+                ret["changes"] = changes
+            # Clean
+            else:
+                ret["changes"] = {}
     return ret
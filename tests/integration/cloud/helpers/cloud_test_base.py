@@ -139,25 +139,29 @@ class CloudTest(ShellCase):
                         return
         # It's not clear from the delete string that deletion was successful, ask salt-cloud after a delay
         query = self.query_instances()
-        # some instances take a while to report their destruction
-        for tries in range(6):
-            if self._instance_exists(query=query):
-                sleep(30)
-                log.debug(
-                    'Instance "%s" still found in query after %s tries: %s',
-                    instance_name,
-                    tries,
-                    query,
-                )
-                query = self.query_instances()
+        # some instances take a while to report their destruction, so poll with
+        # a growing delay which still waits about as long as before in total
+        for tries, delay in enumerate((5, 10, 20, 40, 60, 60)):
+            if not self._instance_exists(instance_name, query):
+                break
+            sleep(delay)
+            log.debug(
+                'Instance "%s" still found in query after %s tries: %s',
+                instance_name,
+                tries,
+                query,
+            )
+            query = self.query_instances()
         # The last query should have been successful
-        self.assertNotIn(instance_name, self.query_instances())
+        self.assertNotIn(instance_name, query)
 
     @property
     def instance_name(self):
         if not hasattr(self, "_instance_name"):
             # Create the cloud instance name to be used throughout the tests
-            subclass = self.__class__.__name__.strip("Test")
+            subclass = type(self).__name__
+            if subclass.endswith("Test"):
+                subclass = subclass[: -len("Test")]
             # Use the first three letters of the subclass, fill with '-' if too short
             self._instance_name = random_string(
                 "cloud-test-{:-<3}-".format(subclass[:3]), uppercase=False
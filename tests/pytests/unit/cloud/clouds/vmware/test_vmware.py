@@ -10,7 +10,7 @@ import pytest
 from salt import config
 from salt.cloud.clouds import vmware
 from salt.exceptions import SaltCloudSystemExit
-from tests.support.mock import MagicMock, Mock, patch
+from tests.support.mock import MagicMock, Mock, call, patch
 
 # Attempt to import pyVim and pyVmomi libs
 HAS_LIBS = True
@@ -1233,3 +1233,81 @@ def test__add_new_hard_disk_helper():
             vmware.salt.utils.vmware.get_mor_using_container_view.assert_called_with(
                 None, vim.StoragePod, "whatever"
             )
+
+
+def test_get_folder_ref_inventory_path():
+    """
+    Tests that a folder given as a full inventory path is found with a single
+    SearchIndex lookup
+    """
+    si = MagicMock()
+    folder_ref = MagicMock(spec=vim.Folder)
+    si.content.searchIndex.FindByInventoryPath.return_value = folder_ref
+    with patch("salt.utils.vmware.get_mor_by_property") as get_mor_by_property:
+        assert vmware._get_folder_ref(si, "/dc1/vm/folder/") is folder_ref
+    si.content.searchIndex.FindByInventoryPath.assert_called_once_with(
+        inventoryPath="dc1/vm/folder"
+    )
+    get_mor_by_property.assert_not_called()
+
+
+def test_get_folder_ref_fallback():
+    """
+    Tests that a folder which is not a full inventory path is looked up part
+    by part, each part below the previous one
+    """
+    si = MagicMock()
+    si.content.searchIndex.FindByInventoryPath.return_value = None
+    container_ref = MagicMock(spec=vim.Datacenter)
+    parent_ref = MagicMock(spec=vim.Folder)
+    folder_ref = MagicMock(spec=vim.Folder)
+    with patch(
+        "salt.utils.vmware.get_mor_by_property",
+        MagicMock(side_effect=[parent_ref, folder_ref]),
+    ) as get_mor_by_property:
+        assert (
+            vmware._get_folder_ref(si, "parent/folder", container_ref=container_ref)
+            is folder_ref
+        )
+    assert get_mor_by_property.call_args_list == [
+        call(si, vim.Folder, "parent", container_ref=container_ref),
+        call(si, vim.Folder, "folder", container_ref=parent_ref),
+    ]
+
+
+def test_get_folder_ref_not_found():
+    """
+    Tests that a folder found neither by inventory path nor part by part is
+    reported as missing
+    """
+    si = MagicMock()
+    si.content.searchIndex.FindByInventoryPath.return_value = None
+    with patch("salt.utils.vmware.get_mor_by_property", MagicMock(return_value=None)):
+        assert vmware._get_folder_ref(si, "folder") is None
+
+
+def test_create_folder_existing_path():
+    """
+    Tests that create_folder creates only the missing parts of a path found
+    with SearchIndex lookups
+    """
+    si = MagicMock()
+    datacenter_ref = MagicMock(spec=vim.Datacenter)
+    datacenter_ref.CreateFolder = MagicMock()
+    folder_ref = MagicMock(spec=vim.Folder)
+    folder_ref.CreateFolder = MagicMock()
+    si.content.searchIndex.FindByInventoryPath.side_effect = [
+        datacenter_ref,
+        folder_ref,
+        None,
+    ]
+    with patch("salt.cloud.clouds.vmware._get_si", MagicMock(return_value=si)):
+        ret = vmware.create_folder(kwargs={"path": "/dc1/vm/new"}, call="function")
+    assert ret == {"/dc1/vm/new": "created the specified path"}
+    assert si.content.searchIndex.FindByInventoryPath.call_args_list == [
+        call(inventoryPath="/dc1"),
+        call(inventoryPath="/dc1/vm"),
+        call(inventoryPath="/dc1/vm/new"),
+    ]
+    folder_ref.CreateFolder.assert_called_once_with("new")
+    datacenter_ref.CreateFolder.assert_not_called()
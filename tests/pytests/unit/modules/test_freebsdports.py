@@ -0,0 +1,238 @@
+"""
+    Test cases for salt.modules.freebsdports
+"""
+
+import os
+
+import pytest
+
+import salt.modules.freebsdports as freebsdports
+from salt.exceptions import CommandExecutionError, SaltInvocationError
+from tests.support.mock import MagicMock, patch
+
+
+@pytest.fixture
+def configure_loader_modules():
+    return {
+        freebsdports: {
+            "__grains__": {"os": "FreeBSD", "osrelease": "13.2"},
+            "__context__": {},
+        }
+    }
+
+
+NMAP_OPTIONS = (
+    "# This file was auto-generated by Salt (http://saltstack.com)\n"
+    "# Options for nmap-7.94\n"
+    "_OPTIONS_READ=nmap-7.94\n"
+    "_FILE_COMPLETE_OPTIONS_LIST=DOCS IPV6\n"
+    "OPTIONS_FILE_SET+=DOCS\n"
+    "OPTIONS_FILE_UNSET+=IPV6\n"
+)
+
+NMAP_SHOWCONFIG = (
+    "===> The following configuration options are available for nmap-7.94:\n"
+    "     DOCS=on: Build and/or install documentation\n"
+    "     IPV6=on: IPv6 protocol support\n"
+    "===> Use 'make config' to modify these settings\n"
+)
+
+PORTSNAP_FETCH = (
+    "Looking up portsnap.FreeBSD.org mirrors... 5 mirrors found.\n"
+    "Fetching snapshot tag from dualstack.aws.portsnap.freebsd.org... done.\n"
+    "Fetching snapshot metadata... done.\n"
+    "Updating from Tue Jun 13 10:01:33 UTC 2023 to Wed Jun 14 08:12:47 UTC 2023.\n"
+    "Fetching 5 metadata patches..... done.\n"
+    "Applying metadata patches... done.\n"
+    "Fetching 0 metadata files... done.\n"
+    "Fetching 21 patches.\n"
+    "(21/21) 100.00%  done.\n"
+    "done.\n"
+    "Applying patches...\n"
+    "done.\n"
+    "Fetching 3 new ports or files... done.\n"
+)
+
+
+@pytest.fixture
+def options_dir(tmp_path):
+    """
+    The options dir of security/nmap, below tmp_path, with the port known to
+    exist
+    """
+    freebsdports.__context__["ports.known_portpaths"] = {"/usr/ports/security/nmap"}
+    dirname = str(tmp_path / "security_nmap")
+    with patch.object(freebsdports, "_options_dir", MagicMock(return_value=dirname)):
+        yield dirname
+
+
+def _run_all(stdout=""):
+    return MagicMock(return_value={"retcode": 0, "stdout": stdout, "stderr": ""})
+
+
+def test_check_portname_remembers_path():
+    """
+    Test that an existing port directory is only checked once
+    """
+    mock_isdir = MagicMock(return_value=True)
+    with patch("os.path.isdir", mock_isdir):
+        for _ in range(2):
+            path = freebsdports._check_portname("security/nmap")
+            assert path == "/usr/ports/security/nmap"
+    mock_isdir.assert_called_once_with("/usr/ports/security/nmap")
+
+
+def test_check_portname_missing():
+    """
+    Test that a missing port directory is checked again every time
+    """
+    mock_isdir = MagicMock(return_value=False)
+    with patch("os.path.isdir", mock_isdir):
+        for _ in range(2):
+            with pytest.raises(SaltInvocationError):
+                freebsdports._check_portname("security/nmap")
+    assert mock_isdir.call_count == 2
+
+
+def test_update_clears_known_portpaths():
+    """
+    Test that updating the ports tree makes port directories be checked again
+    """
+    mock_isdir = MagicMock(return_value=True)
+    with patch("os.path.isdir", mock_isdir):
+        freebsdports._check_portname("security/nmap")
+        with patch.dict(freebsdports.__salt__, {"cmd.run_all": _run_all()}):
+            freebsdports.update()
+        assert "ports.known_portpaths" not in freebsdports.__context__
+        freebsdports._check_portname("security/nmap")
+    assert mock_isdir.call_count == 2
+
+
+def _read(path):
+    with open(path) as fp_:
+        return fp_.read()
+
+
+def test_write_options(options_dir):
+    """
+    Test writing the options file of a port, creating its directory
+    """
+    freebsdports._write_options(
+        "security/nmap", {"nmap-7.94": {"IPV6": "off", "DOCS": "on"}}
+    )
+    assert os.listdir(options_dir) == ["options"]
+    assert _read(os.path.join(options_dir, "options")) == NMAP_OPTIONS
+
+
+def test_write_options_existing_dir(options_dir):
+    """
+    Test that an existing options file is replaced in its existing directory
+    """
+    os.makedirs(options_dir)
+    with open(os.path.join(options_dir, "options"), "w") as fp_:
+        fp_.write("OPTIONS_FILE_SET+=IPV6\n")
+    freebsdports._write_options(
+        "security/nmap", {"nmap-7.94": {"IPV6": "off", "DOCS": "on"}}
+    )
+    assert os.listdir(options_dir) == ["options"]
+    assert _read(os.path.join(options_dir, "options")) == NMAP_OPTIONS
+
+
+def _config(**kwargs):
+    with patch.dict(freebsdports.__salt__, {"cmd.run_all": _run_all(NMAP_SHOWCONFIG)}):
+        return freebsdports.config("security/nmap", **kwargs)
+
+
+def test_read_options(options_dir):
+    """
+    Test reading back the options file of a port
+    """
+    os.makedirs(options_dir)
+    with open(os.path.join(options_dir, "options"), "w") as fp_:
+        fp_.write(NMAP_OPTIONS)
+    assert freebsdports._read_options("security/nmap") == {
+        "DOCS": "on",
+        "IPV6": "off",
+    }
+
+
+def test_config(options_dir):
+    """
+    Test configuring a port, verified by reading back its options file
+    """
+    assert _config(IPV6=False) is True
+    assert _read(os.path.join(options_dir, "options")) == NMAP_OPTIONS
+
+
+def test_config_invalid_option(options_dir):
+    """
+    Test that unknown options and invalid values are all rejected at once,
+    before the options file is written
+    """
+    with pytest.raises(SaltInvocationError, match="FOO, BAR"):
+        _config(FOO="on", IPV6="off", BAR="off")
+    with pytest.raises(SaltInvocationError, match="DOCS=maybe, IPV6=1"):
+        _config(DOCS="maybe", IPV6=1)
+    assert not os.path.exists(options_dir)
+
+
+def test_config_read_back_mismatch(options_dir):
+    """
+    Test that config reports failure if the options file read back does not
+    hold the requested options
+    """
+    os.makedirs(options_dir)
+    with open(os.path.join(options_dir, "options"), "w") as fp_:
+        fp_.write("OPTIONS_FILE_SET+=DOCS\nOPTIONS_FILE_SET+=IPV6\n")
+    # the new options file never makes it to disk
+    with patch.object(freebsdports, "_write_options"):
+        assert _config(IPV6="off") is False
+
+
+def test_config_read_back_missing(options_dir):
+    """
+    Test that config reports failure if the options file can't be read back
+    """
+    with patch.object(freebsdports, "_write_options"):
+        assert _config(IPV6="off") is False
+
+
+def test_config_no_showconfig(options_dir):
+    """
+    Test that a port without configuration options can't be configured
+    """
+    with patch.dict(freebsdports.__salt__, {"cmd.run_all": _run_all()}):
+        with pytest.raises(CommandExecutionError):
+            freebsdports.config("security/nmap", IPV6="off")
+
+
+@pytest.mark.parametrize(
+    "stdout,expected",
+    [
+        (
+            PORTSNAP_FETCH,
+            "Applied 21 new patches\nFetched 3 new ports or files",
+        ),
+        (
+            # only the first count of each kind is reported
+            PORTSNAP_FETCH + "Fetching 7 patches.\nFetching 9 new ports or files\n",
+            "Applied 21 new patches\nFetched 3 new ports or files",
+        ),
+        (
+            "Fetching snapshot metadata... done.\n"
+            "Ports tree hasn't changed since last snapshot.\n",
+            "Applied 0 new patches\nFetched 0 new ports or files",
+        ),
+    ],
+)
+def test_update_fetch_counts(stdout, expected):
+    """
+    Test the counts reported from the output of 'portsnap fetch'
+    """
+    mock_run_all = _run_all(stdout)
+    with patch.dict(freebsdports.__salt__, {"cmd.run_all": mock_run_all}):
+        assert freebsdports.update() == expected
+    assert [call[0][0] for call in mock_run_all.call_args_list] == [
+        ["portsnap", "--interactive", "fetch"],
+        ["portsnap", "--interactive", "update"],
+    ]
@@ -0,0 +1,129 @@
+"""
+    Test cases for salt.pillar.cmd_json
+"""
+
+import copy
+import math
+import types
+
+import pytest
+
+import salt.pillar.cmd_json as cmd_json
+from tests.support.mock import MagicMock, patch
+
+
+@pytest.fixture
+def configure_loader_modules():
+    return {cmd_json: {"__opts__": {}}}
+
+
+def _ext_pillar(output):
+    with patch.dict(cmd_json.__salt__, {"cmd.run": MagicMock(return_value=output)}):
+        return cmd_json.ext_pillar("minion1", {}, "echo")
+
+
+@pytest.fixture
+def cache():
+    """
+    Patch salt.cache.Cache with an in-memory cache shared by all instances
+    """
+    banks = {}
+
+    class Cache:
+        def __init__(self, opts):
+            pass
+
+        def fetch(self, bank, key):
+            return copy.deepcopy(banks.get(bank, {}).get(key, {}))
+
+        def store(self, bank, key, data):
+            banks.setdefault(bank, {})[key] = copy.deepcopy(data)
+
+    with patch("salt.cache.Cache", Cache), patch.dict(
+        cmd_json.__opts__, {"cmd_json_cache_ttl": 60}
+    ):
+        yield banks
+
+
+def _cached_ext_pillar(command, minion_ids=("minion1", "minion2")):
+    mock_run = MagicMock(return_value='{"arg": "value"}')
+    with patch.dict(cmd_json.__salt__, {"cmd.run": mock_run}):
+        for minion_id in minion_ids:
+            assert cmd_json.ext_pillar(minion_id, {}, command) == {"arg": "value"}
+    return mock_run
+
+
+def test_ext_pillar_json_module():
+    """
+    Test parsing the output with salt.utils.json when orjson is not installed
+    """
+    with patch.object(cmd_json, "HAS_ORJSON", False):
+        assert _ext_pillar('{"arg": "value"}') == {"arg": "value"}
+        assert math.isnan(_ext_pillar('{"arg": NaN}')["arg"])
+        assert _ext_pillar("not json") == {}
+
+
+def test_ext_pillar_orjson():
+    """
+    Test parsing the output with orjson
+    """
+    pytest.importorskip("orjson")
+    with patch.object(cmd_json, "HAS_ORJSON", True):
+        assert _ext_pillar('{"arg": "value"}') == {"arg": "value"}
+        assert math.isnan(_ext_pillar('{"arg": NaN}')["arg"])
+        for number in (2**64 - 1, 2**64, -(2**63) - 1, 2**70):
+            assert _ext_pillar(f'{{"arg": {number}}}') == {"arg": number}
+        assert _ext_pillar("not json") == {}
+
+
+def test_ext_pillar_orjson_fallback():
+    """
+    Test that output orjson rejects is still parsed with salt.utils.json
+    """
+
+    class JSONDecodeError(ValueError):
+        pass
+
+    fake_orjson = types.SimpleNamespace(
+        JSONDecodeError=JSONDecodeError,
+        loads=MagicMock(side_effect=JSONDecodeError("rejected")),
+    )
+    with patch.object(cmd_json, "HAS_ORJSON", True), patch.object(
+        cmd_json, "orjson", fake_orjson, create=True
+    ):
+        assert math.isinf(_ext_pillar('{"arg": Infinity}')["arg"])
+        assert fake_orjson.loads.call_count == 1
+        # orjson would return a float for this, so it isn't used at all
+        assert _ext_pillar(f'{{"arg": {2**70}}}') == {"arg": 2**70}
+        assert fake_orjson.loads.call_count == 1
+
+
+def test_ext_pillar_cache_hit(cache):
+    """
+    Test that compiles within cmd_json_cache_ttl reuse the cached output
+    """
+    mock_run = _cached_ext_pillar("echo")
+    mock_run.assert_called_once_with("echo")
+    assert len(cache["pillar/cmd_json"]) == 1
+
+
+def test_ext_pillar_cache_expired(cache):
+    """
+    Test that the command is run again once the cached output is older than
+    cmd_json_cache_ttl
+    """
+    _cached_ext_pillar("echo", ["minion1"])
+    for cached in cache["pillar/cmd_json"].values():
+        cached["time"] -= 120
+    mock_run = _cached_ext_pillar("echo", ["minion2"])
+    mock_run.assert_called_once_with("echo")
+
+
+def test_ext_pillar_cache_minion_id(cache):
+    """
+    Test that the output of commands containing the minion id is not cached
+    """
+    mock_run = _cached_ext_pillar("echo %s")
+    assert mock_run.call_count == 2
+    mock_run.assert_called_with("echo minion2")
+    assert cache == {}
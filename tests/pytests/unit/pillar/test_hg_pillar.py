@@ -0,0 +1,91 @@
+"""
+    Test cases for salt.pillar.hg_pillar
+"""
+
+import os
+
+import pytest
+
+import salt.pillar.hg_pillar as hg_pillar
+from tests.support.mock import MagicMock, patch
+
+REPO_URI = "ssh://hg@example.com/pillar"
+
+
+@pytest.fixture
+def configure_loader_modules(tmp_path):
+    return {
+        hg_pillar: {
+            "__opts__": {"cachedir": str(tmp_path), "pillar_roots": {}},
+            "__grains__": {},
+        }
+    }
+
+
+@pytest.fixture
+def hglib():
+    mock_hglib = MagicMock()
+
+    def clone(repo_uri, working_dir):
+        os.makedirs(working_dir)
+        return mock_hglib.clone.return_value
+
+    mock_hglib.clone.side_effect = clone
+    with patch.object(hg_pillar, "hglib", mock_hglib):
+        yield mock_hglib
+
+
+def test_ext_pillar_closes_repo(hglib):
+    """
+    Test that every ext_pillar call closes the repo it opened, so no
+    mercurial command server outlives the pillar compile
+    """
+    with patch("salt.pillar.Pillar") as mock_pillar:
+        mock_pillar.return_value.compile_pillar.return_value = {"key": "value"}
+        for _ in range(2):
+            assert hg_pillar.ext_pillar("minion1", {}, REPO_URI) == {"key": "value"}
+    for repo in (hglib.clone.return_value, hglib.open.return_value):
+        repo.update.assert_called_once_with("default", clean=True)
+        repo.close.assert_called_once()
+
+
+def test_update_skips_recent_pull(hglib):
+    """
+    Test that a repo pulled by an earlier compile is not pulled again within
+    hg_pillar_pull_interval, even though every compile opens its own Repo
+    """
+    with hg_pillar.Repo(REPO_URI) as repo:
+        repo.update()
+    assert os.path.isfile(repo.pull_stamp)
+    with hg_pillar.Repo(REPO_URI) as repo:
+        repo.update("test")
+    hglib.clone.return_value.pull.assert_called_once()
+    hglib.open.return_value.pull.assert_not_called()
+    hglib.open.return_value.update.assert_called_once_with("test", clean=True)
+
+
+def test_update_pulls_after_interval(hglib):
+    """
+    Test that the repo is pulled again once the last pull is older than
+    hg_pillar_pull_interval
+    """
+    with hg_pillar.Repo(REPO_URI) as repo:
+        repo.update()
+    stale = os.path.getmtime(repo.pull_stamp) - 120
+    os.utime(repo.pull_stamp, (stale, stale))
+    with hg_pillar.Repo(REPO_URI) as repo:
+        repo.update()
+    hglib.open.return_value.pull.assert_called_once()
+    assert os.path.getmtime(repo.pull_stamp) > stale
+
+
+def test_update_pull_interval_zero(hglib):
+    """
+    Test that an hg_pillar_pull_interval of 0 pulls on every update
+    """
+    with patch.dict(hg_pillar.__opts__, {"hg_pillar_pull_interval": 0}):
+        for _ in range(2):
+            with hg_pillar.Repo(REPO_URI) as repo:
+                repo.update()
+    hglib.clone.return_value.pull.assert_called_once()
+    hglib.open.return_value.pull.assert_called_once()
@@ -39,6 +39,9 @@ class GlobalConfig:
         "An error occurred (101) when calling the {0} operation: Test-defined error"
     )
     error_content = {"Error": {"Code": 101, "Message": "Test-defined error"}}
+    not_found_error_content = {
+        "Error": {"Code": "ResourceNotFoundException", "Message": "Test-defined error"}
+    }
     function_ret = dict(
         FunctionName="testfunction",
         Runtime="python2.7",
@@ -125,9 +128,11 @@ def test_present_when_function_does_not_exist_func(global_config, session_instan
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.side_effect = [
-        {"Functions": []},
-        {"Functions": [global_config.function_ret]},
+    conn.get_function_configuration.side_effect = [
+        botocore.exceptions.ClientError(
+            global_config.not_found_error_content, "get_function_configuration"
+        ),
+        global_config.function_ret,
     ]
     conn.create_function.return_value = global_config.function_ret
     with patch.dict(
@@ -156,7 +161,7 @@ def test_present_when_function_exists_func(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.return_value = {"Functions": [global_config.function_ret]}
+    conn.get_function_configuration.return_value = global_config.function_ret
     conn.update_function_code.return_value = global_config.function_ret
 
     with patch.dict(
@@ -191,9 +196,11 @@ def test_present_with_failure_func(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.side_effect = [
-        {"Functions": []},
-        {"Functions": [global_config.function_ret]},
+    conn.get_function_configuration.side_effect = [
+        botocore.exceptions.ClientError(
+            global_config.not_found_error_content, "get_function_configuration"
+        ),
+        global_config.function_ret,
     ]
     conn.create_function.side_effect = botocore.exceptions.ClientError(
         global_config.error_content, "create_function"
@@ -232,7 +239,9 @@ def test_absent_when_function_does_not_exist_func(global_config, session_instanc
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.return_value = {"Functions": [global_config.function_ret]}
+    conn.get_function_configuration.side_effect = botocore.exceptions.ClientError(
+        global_config.not_found_error_content, "get_function_configuration"
+    )
     result = boto_lambda.__states__["boto_lambda.function_absent"]("test", "myfunc")
     assert result["result"]
     assert result["changes"] == {}
@@ -242,7 +251,7 @@ def test_absent_when_function_exists_func(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.return_value = {"Functions": [global_config.function_ret]}
+    conn.get_function_configuration.return_value = global_config.function_ret
     result = boto_lambda.__states__["boto_lambda.function_absent"](
         "test", global_config.function_ret["FunctionName"]
     )
@@ -254,7 +263,7 @@ def test_absent_with_failure_func(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.return_value = {"Functions": [global_config.function_ret]}
+    conn.get_function_configuration.return_value = global_config.function_ret
     conn.delete_function.side_effect = botocore.exceptions.ClientError(
         global_config.error_content, "delete_function"
     )
@@ -272,7 +281,7 @@ def test_present_when_function_exists_and_permissions_func(
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_functions.return_value = {"Functions": [global_config.function_ret]}
+    conn.get_function_configuration.return_value = global_config.function_ret
     conn.update_function_code.return_value = global_config.function_ret
     conn.get_policy.return_value = {
         "Policy": salt.utils.json.dumps(
@@ -344,9 +353,11 @@ def test_present_when_alias_does_not_exist(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.side_effect = [
-        {"Aliases": []},
-        {"Aliases": [global_config.alias_ret]},
+    conn.get_alias.side_effect = [
+        botocore.exceptions.ClientError(
+            global_config.not_found_error_content, "get_alias"
+        ),
+        global_config.alias_ret,
     ]
     conn.create_alias.return_value = global_config.alias_ret
     result = boto_lambda.__states__["boto_lambda.alias_present"](
@@ -364,7 +375,7 @@ def test_present_when_alias_exists(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.return_value = {"Aliases": [global_config.alias_ret]}
+    conn.get_alias.return_value = global_config.alias_ret
     conn.create_alias.return_value = global_config.alias_ret
     result = boto_lambda.__states__["boto_lambda.alias_present"](
         "alias present",
@@ -382,9 +393,11 @@ def test_present_with_failure_glob(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.side_effect = [
-        {"Aliases": []},
-        {"Aliases": [global_config.alias_ret]},
+    conn.get_alias.side_effect = [
+        botocore.exceptions.ClientError(
+            global_config.not_found_error_content, "get_alias"
+        ),
+        global_config.alias_ret,
     ]
     conn.create_alias.side_effect = botocore.exceptions.ClientError(
         global_config.error_content, "create_alias"
@@ -406,7 +419,9 @@ def test_absent_when_alias_does_not_exist(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.return_value = {"Aliases": [global_config.alias_ret]}
+    conn.get_alias.side_effect = botocore.exceptions.ClientError(
+        global_config.not_found_error_content, "get_alias"
+    )
     result = boto_lambda.__states__["boto_lambda.alias_absent"](
         "alias absent", FunctionName="testfunc", Name="myalias"
     )
@@ -418,7 +433,7 @@ def test_absent_when_alias_exists(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.return_value = {"Aliases": [global_config.alias_ret]}
+    conn.get_alias.return_value = global_config.alias_ret
     result = boto_lambda.__states__["boto_lambda.alias_absent"](
         "alias absent", FunctionName="testfunc", Name=global_config.alias_ret["Name"]
     )
@@ -430,7 +445,7 @@ def test_absent_with_failure(global_config, session_instance):
     conn = MagicMock()
     session_instance.client.return_value = conn
 
-    conn.list_aliases.return_value = {"Aliases": [global_config.alias_ret]}
+    conn.get_alias.return_value = global_config.alias_ret
     conn.delete_alias.side_effect = botocore.exceptions.ClientError(
         global_config.error_content, "delete_alias"
     )
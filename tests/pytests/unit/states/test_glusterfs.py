@@ -62,6 +62,7 @@ def test_peered():
                     "uuid2": {"hostnames": ["someAlias", name]},
                 }
                 mock_status.side_effect = [old, new]
+                glusterfs.__context__.clear()
                 comt = f"Host {name} successfully peered"
                 ret.update({"comment": comt, "changes": {"old": old, "new": new}})
                 assert glusterfs.peered(name) == ret
@@ -69,6 +70,7 @@ def test_peered():
 
                 mock_status.return_value = {"uuid1": {"hostnames": ["other"]}}
                 mock_peer.return_value = False
+                glusterfs.__context__.clear()
 
                 ret.update({"result": False})
 
@@ -89,6 +91,27 @@ def test_peered():
                 assert glusterfs.peered(name) == ret
 
 
+def test_peered_own_hostname():
+    """
+    Test that peering with the minion's own host name skips all lookups
+    """
+    mock_host_ips = MagicMock()
+    mock_status = MagicMock()
+
+    with patch.dict(glusterfs.__grains__, {"host": "server1"}), patch.dict(
+        glusterfs.__salt__, {"glusterfs.peer_status": mock_status}
+    ), patch.object(salt.utils.network, "host_to_ips", mock_host_ips):
+        assert glusterfs.peered("server1") == {
+            "name": "server1",
+            "result": True,
+            "comment": "Peering with localhost is not needed",
+            "changes": {},
+        }
+
+    mock_host_ips.assert_not_called()
+    mock_status.assert_not_called()
+
+
 def test_volume_present():
     """
     Test to ensure that a volume exists
@@ -122,6 +145,7 @@ def test_volume_present():
             assert glusterfs.volume_present(name, bricks, start=True) == ret
 
             mock_info.return_value = stopped_info
+            glusterfs.__context__.clear()
             comt = f"Volume {name} already exists and is now started"
             ret.update(
                 {"comment": comt, "changes": {"old": "stopped", "new": "started"}}
@@ -141,6 +165,7 @@ def test_volume_present():
             assert glusterfs.volume_present(name, bricks, start=True) == ret
 
             mock_list.return_value = []
+            glusterfs.__context__.clear()
             comt = f"Volume {name} will be created"
             ret.update({"comment": comt, "result": None})
             assert glusterfs.volume_present(name, bricks, start=False) == ret
@@ -151,6 +176,7 @@ def test_volume_present():
 
         with patch.dict(glusterfs.__opts__, {"test": False}):
             mock_list.side_effect = [[], [name]]
+            glusterfs.__context__.clear()
             comt = f"Volume {name} is created"
             ret.update(
                 {
@@ -162,6 +188,7 @@ def test_volume_present():
             assert glusterfs.volume_present(name, bricks, start=False) == ret
 
             mock_list.side_effect = [[], [name]]
+            glusterfs.__context__.clear()
             comt = f"Volume {name} is created and is now started"
             ret.update({"comment": comt, "result": True})
             assert glusterfs.volume_present(name, bricks, start=True) == ret
@@ -169,6 +196,7 @@ def test_volume_present():
             mock_list.side_effect = None
             mock_list.return_value = []
             mock_create.return_value = False
+            glusterfs.__context__.clear()
             comt = f"Creation of volume {name} failed"
             ret.update({"comment": comt, "result": False, "changes": {}})
             assert glusterfs.volume_present(name, bricks) == ret
@@ -201,12 +229,14 @@ def test_started():
         assert glusterfs.started(name) == ret
 
         mock_info.return_value = started_info
+        glusterfs.__context__.clear()
         comt = f"Volume {name} is already started"
         ret.update({"comment": comt, "result": True})
         assert glusterfs.started(name) == ret
 
         with patch.dict(glusterfs.__opts__, {"test": True}):
             mock_info.return_value = stopped_info
+            glusterfs.__context__.clear()
             comt = f"Volume {name} will be started"
             ret.update({"comment": comt, "result": None})
             assert glusterfs.started(name) == ret
@@ -256,10 +286,12 @@ def test_add_volume_bricks():
         assert glusterfs.add_volume_bricks(name, bricks) == ret
 
         mock_info.return_value = stopped_volinfo
+        glusterfs.__context__.clear()
         ret.update({"comment": "Volume salt is not started"})
         assert glusterfs.add_volume_bricks(name, bricks) == ret
 
         mock_info.return_value = volinfo
+        glusterfs.__context__.clear()
         ret.update({"comment": "Adding bricks to volume salt failed"})
         assert glusterfs.add_volume_bricks(name, bricks) == ret
 
@@ -268,6 +300,7 @@ def test_add_volume_bricks():
         assert glusterfs.add_volume_bricks(name, old_bricks) == ret
 
         mock_info.side_effect = [volinfo, new_volinfo]
+        glusterfs.__context__.clear()
         ret.update(
             {
                 "comment": "Bricks successfully added to volume salt",
@@ -282,6 +315,25 @@ def test_add_volume_bricks():
         assert result == ret
 
 
+def test_volume_present_reuses_volume_list_and_info():
+    """
+    Test that volume_present only queries gluster once per state run
+    """
+    started_info = {"salt1": {"status": "1"}, "salt2": {"status": "1"}}
+    mock_info = MagicMock(return_value=started_info)
+    mock_list = MagicMock(return_value=["salt1", "salt2"])
+
+    with patch.dict(
+        glusterfs.__salt__,
+        {"glusterfs.info": mock_info, "glusterfs.list_volumes": mock_list},
+    ), patch.dict(glusterfs.__opts__, {"test": False}):
+        assert glusterfs.volume_present("salt1", [], start=True)["result"] is True
+        assert glusterfs.volume_present("salt2", [], start=True)["result"] is True
+
+    mock_list.assert_called_once_with()
+    mock_info.assert_called_once_with()
+
+
 def test_op_version():
     """
     Test setting the Glusterfs op-version
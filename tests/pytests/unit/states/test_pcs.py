@@ -0,0 +1,369 @@
+"""
+    Test cases for salt.states.pcs
+"""
+
+import hashlib
+import os
+
+import pytest
+
+import salt.states.pcs as pcs
+from tests.support.mock import MagicMock, patch
+
+
+@pytest.fixture
+def configure_loader_modules(tmp_path):
+    return {
+        pcs: {
+            "__opts__": {"cachedir": str(tmp_path), "test": False},
+            "__env__": "base",
+            "__context__": {},
+            "__grains__": {},
+        }
+    }
+
+
+def _get_hash(path, form):
+    with open(path, "rb") as fp_:
+        return hashlib.new(form, fp_.read()).hexdigest()
+
+
+@pytest.fixture
+def cib():
+    """
+    A cached CIB-file with its checksum and recorded stat, as left behind by
+    pcs.cib_present. The stat is dated a second after the last change of the
+    CIB-file, so it is trusted.
+    """
+    cibfile = pcs._get_cibfile("cib_for_test")
+    os.makedirs(os.path.dirname(cibfile))
+    with open(cibfile, "w") as fp_:
+        fp_.write("<cib>original</cib>\n")
+    with open(pcs._get_cibfile_cksum("cib_for_test"), "w") as fp_:
+        fp_.write(f"sha256:{_get_hash(cibfile, 'sha256')}")
+    cibfile_stat = pcs._get_cibfile_stat("cib_for_test")
+    pcs._record_cib_stat(cibfile, cibfile_stat)
+    recorded_ns = os.stat(cibfile).st_ctime_ns + 10**9
+    os.utime(cibfile_stat, ns=(recorded_ns, recorded_ns))
+    return cibfile
+
+
+def _cib_pushed():
+    mock_hash = MagicMock(side_effect=_get_hash)
+    mock_push = MagicMock(return_value={"retcode": 0})
+    with patch.dict(
+        pcs.__salt__, {"file.get_hash": mock_hash, "pcs.cib_push": mock_push}
+    ):
+        ret = pcs.cib_pushed("cib_pushed", "cib_for_test")
+    return ret, mock_hash, mock_push
+
+
+def test_cib_pushed_unchanged_stat(cib):
+    """
+    Test that an untouched CIB-file is neither hashed nor pushed
+    """
+    ret, mock_hash, mock_push = _cib_pushed()
+    assert ret["result"] is True
+    assert ret["changes"] == {}
+    mock_hash.assert_not_called()
+    mock_push.assert_not_called()
+
+
+def test_cib_pushed_changed_content(cib):
+    """
+    Test that a changed CIB-file is pushed
+    """
+    with open(cib, "w") as fp_:
+        fp_.write("<cib>changed by pcs -f</cib>\n")
+    ret, mock_hash, mock_push = _cib_pushed()
+    assert ret["result"] is True
+    assert ret["changes"] == {"cibfile_pushed": cib}
+    mock_hash.assert_called_once()
+    mock_push.assert_called_once()
+
+
+def test_cib_pushed_missing_stat(cib):
+    """
+    Test that without a recorded stat the CIB-file is hashed, and not pushed
+    as long as it matches its checksum
+    """
+    os.remove(pcs._get_cibfile_stat("cib_for_test"))
+    ret, mock_hash, mock_push = _cib_pushed()
+    assert ret["changes"] == {}
+    mock_hash.assert_called_once()
+    mock_push.assert_not_called()
+
+
+def test_cib_pushed_racy_stat(cib):
+    """
+    Test that a stat recorded in the same timestamp tick as the last change
+    of the CIB-file is not trusted, and the CIB-file is hashed
+    """
+    cibfile_stat = pcs._get_cibfile_stat("cib_for_test")
+    ctime_ns = os.stat(cib).st_ctime_ns
+    os.utime(cibfile_stat, ns=(ctime_ns, ctime_ns))
+    ret, mock_hash, mock_push = _cib_pushed()
+    assert ret["changes"] == {}
+    mock_hash.assert_called_once()
+    mock_push.assert_not_called()
+
+
+def test_cib_pushed_mtime_reset(cib):
+    """
+    Test that a CIB-file changed in place to the same size, with its mtime
+    restored afterwards (like ``cp -p`` or ``touch -r``), is pushed
+    """
+    stat = os.stat(cib)
+    with open(cib, "r+") as fp_:
+        fp_.write("<cib>modified</cib>\n")
+    os.utime(cib, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(cib).st_size == stat.st_size
+
+    ret, mock_hash, mock_push = _cib_pushed()
+    assert ret["changes"] == {"cibfile_pushed": cib}
+    mock_hash.assert_called_once()
+    mock_push.assert_called_once()
+
+
+PROPERTY_SHOW = {
+    "retcode": 0,
+    "stdout": (
+        "Cluster Properties:\n" " stonith-enabled: false\n" " no-quorum-policy: stop\n"
+    ),
+}
+
+
+def test_prop_has_value_reuses_item_show():
+    """
+    Test that property states share the output of one 'pcs property show'
+    """
+    mock_show = MagicMock(return_value=PROPERTY_SHOW)
+    mock_create = MagicMock()
+    with patch.dict(
+        pcs.__salt__, {"pcs.item_show": mock_show, "pcs.item_create": mock_create}
+    ):
+        ret = pcs.prop_has_value("prop1", "stonith-enabled", "false")
+        assert ret["result"] is True
+        ret = pcs.prop_has_value("prop2", "no-quorum-policy", "stop")
+        assert ret["result"] is True
+    mock_show.assert_called_once()
+    mock_create.assert_not_called()
+
+
+def test_prop_has_value_create_clears_item_show():
+    """
+    Test that creating an item makes the next state run 'pcs property show'
+    again
+    """
+    mock_show = MagicMock(return_value=PROPERTY_SHOW)
+    mock_create = MagicMock(return_value={"retcode": 0})
+    with patch.dict(
+        pcs.__salt__, {"pcs.item_show": mock_show, "pcs.item_create": mock_create}
+    ):
+        ret = pcs.prop_has_value("prop1", "stonith-enabled", "true")
+        assert ret["changes"] == {
+            "stonith-enabled=true": {"old": "", "new": "stonith-enabled=true"}
+        }
+        assert "pcs.item_show" not in pcs.__context__
+        pcs.prop_has_value("prop2", "no-quorum-policy", "stop")
+    assert mock_show.call_count == 2
+    mock_create.assert_called_once()
+
+
+def test_cib_pushed_clears_item_show(cib):
+    """
+    Test that pushing a CIB drops the cached show output
+    """
+    pcs.__context__["pcs.item_show"] = {("property", None, "show", None): {}}
+    with open(cib, "w") as fp_:
+        fp_.write("<cib>changed by pcs -f</cib>\n")
+    _, _, mock_push = _cib_pushed()
+    mock_push.assert_called_once()
+    assert "pcs.item_show" not in pcs.__context__
+
+
+def test_cib_present_replace_clears_item_show(cib):
+    """
+    Test that replacing the cached CIB-file drops the cached show output
+    """
+
+    def cib_create(cibfile, scope, extra_args):
+        with open(cibfile, "w") as fp_:
+            fp_.write("<cib>new live cib</cib>\n")
+        return {"retcode": 0}
+
+    pcs.__context__["pcs.item_show"] = {("property", None, "show", cib): {}}
+    with patch.dict(
+        pcs.__salt__,
+        {
+            "pcs.cib_create": MagicMock(side_effect=cib_create),
+            "file.get_hash": MagicMock(side_effect=_get_hash),
+        },
+    ):
+        ret = pcs.cib_present("cib_present", "cib_for_test")
+    assert ret["changes"]["cibfile"] == cib
+    assert "pcs.item_show" not in pcs.__context__
+
+
+def _pcs_version(version="0.10.8"):
+    return {
+        "pkg.version": MagicMock(return_value=version),
+        "pkg.version_cmp": MagicMock(return_value=1),
+    }
+
+
+def test_cluster_setup_clears_item_show():
+    """
+    Test that setting up the cluster drops the cached show output
+    """
+    pcs.__context__["pcs.item_show"] = {("property", None, "show", None): {}}
+    with patch.dict(
+        pcs.__salt__,
+        {
+            "pcs.config_show": MagicMock(
+                return_value={"stdout": "Cluster Name: othercluster\n"}
+            ),
+            "pcs.cluster_setup": MagicMock(
+                return_value={"stdout": "node1: Succeeded\n"}
+            ),
+            **_pcs_version(),
+        },
+    ):
+        ret = pcs.cluster_setup("cluster_setup", ["node1"])
+    assert ret["result"] is True
+    assert "pcs.item_show" not in pcs.__context__
+
+
+def _status_nodes_corosync(*members):
+    return {
+        "retcode": 0,
+        "stdout": f"Corosync Nodes:\n Online: {' '.join(members)}\n Offline:\n",
+    }
+
+
+def test_cluster_node_present_reuses_membership():
+    """
+    Test that cluster_node_present states share one corosync membership check
+    """
+    mock_status = MagicMock(return_value=_status_nodes_corosync("node1", "node2"))
+    mock_add = MagicMock()
+    with patch.dict(
+        pcs.__salt__, {"cmd.run_all": mock_status, "pcs.cluster_node_add": mock_add}
+    ):
+        for node in ("node1", "node2"):
+            ret = pcs.cluster_node_present(f"present_{node}", node)
+            assert ret["result"] is True
+            assert ret["changes"] == {}
+    mock_status.assert_called_once()
+    mock_add.assert_not_called()
+
+
+def test_cluster_node_present_add_clears_membership():
+    """
+    Test that adding a node makes the next state check the membership again
+    """
+    mock_status = MagicMock(
+        side_effect=[
+            _status_nodes_corosync("node1"),
+            _status_nodes_corosync("node1", "node2"),
+        ]
+    )
+    mock_add = MagicMock(
+        return_value={"stdout": "node1: Corosync updated\nnode2: Succeeded\n"}
+    )
+    with patch.dict(
+        pcs.__salt__, {"cmd.run_all": mock_status, "pcs.cluster_node_add": mock_add}
+    ):
+        ret = pcs.cluster_node_present("present_node2", "node2")
+        assert ret["changes"] == {"node2": {"old": "", "new": "Added"}}
+        assert "pcs.status_nodes_corosync" not in pcs.__context__
+        ret = pcs.cluster_node_present("present_node2_again", "node2")
+        assert ret["changes"] == {}
+    assert mock_status.call_count == 2
+    mock_add.assert_called_once()
+
+
+def test_cluster_setup_clears_membership():
+    """
+    Test that setting up the cluster drops the cached membership
+    """
+    pcs.__context__["pcs.status_nodes_corosync"] = _status_nodes_corosync("node1")
+    with patch.dict(
+        pcs.__salt__,
+        {
+            "pcs.config_show": MagicMock(
+                return_value={"stdout": "Cluster Name: othercluster\n"}
+            ),
+            "pcs.cluster_setup": MagicMock(
+                return_value={"stdout": "node1: Succeeded\n"}
+            ),
+            **_pcs_version(),
+        },
+    ):
+        pcs.cluster_setup("cluster_setup", ["node1"])
+    assert "pcs.status_nodes_corosync" not in pcs.__context__
+
+
+def test_auth_reuses_is_auth():
+    """
+    Test that auth states for the same nodes share one authorization check
+    """
+    mock_is_auth = MagicMock(return_value={"stdout": "node1: Already authorized\n"})
+    mock_auth = MagicMock()
+    with patch.dict(
+        pcs.__salt__,
+        {"pcs.is_auth": mock_is_auth, "pcs.auth": mock_auth, **_pcs_version()},
+    ):
+        for name in ("auth1", "auth2"):
+            ret = pcs.auth(name, ["node1"])
+            assert ret["result"] is True
+            assert ret["changes"] == {}
+    mock_is_auth.assert_called_once()
+    mock_auth.assert_not_called()
+
+
+def test_auth_clears_is_auth():
+    """
+    Test that authorizing nodes makes the next state check the authorization
+    again
+    """
+    mock_is_auth = MagicMock(
+        side_effect=[
+            {"stdout": "node1: Unable to authenticate to node1\n"},
+            {"stdout": "node1: Already authorized\n"},
+        ]
+    )
+    mock_auth = MagicMock(return_value={"stdout": "node1: Authorized\n"})
+    with patch.dict(
+        pcs.__salt__,
+        {"pcs.is_auth": mock_is_auth, "pcs.auth": mock_auth, **_pcs_version()},
+    ):
+        ret = pcs.auth("auth1", ["node1"])
+        assert ret["changes"] == {"node1": {"old": "", "new": "Authorized"}}
+        assert pcs.__context__["pcs.is_auth"] == {}
+        ret = pcs.auth("auth2", ["node1"])
+        assert ret["changes"] == {}
+    assert mock_is_auth.call_count == 2
+    mock_auth.assert_called_once()
+
+
+def test_auth_is_auth_keyed_by_password():
+    """
+    Test that an authorization check made with another password is not
+    reused, and that the password itself is not kept
+    """
+    mock_is_auth = MagicMock(
+        side_effect=[
+            {"stdout": "node1: Unable to authenticate to node1\n"},
+            {"stdout": "node1: Already authorized\n"},
+        ]
+    )
+    with patch.dict(
+        pcs.__salt__, {"pcs.is_auth": mock_is_auth, **_pcs_version()}
+    ), patch.dict(pcs.__opts__, {"test": True}):
+        ret = pcs.auth("auth1", ["node1"], pcspasswd="wrongpasswd")
+        assert ret["result"] is None
+        ret = pcs.auth("auth2", ["node1"], pcspasswd="rightpasswd")
+        assert ret["result"] is True
+    assert mock_is_auth.call_count == 2
+    assert "passwd" not in str(pcs.__context__["pcs.is_auth"])
@@ -128,3 +128,26 @@ def test_syncronized_test_true():
             mock = MagicMock(return_value=ret)
             with patch.dict(rsync.__salt__, {"rsync.rsync": mock}):
                 assert rsync.synchronized("name", "source") == _expected
+
+
+def test_syncronized_whole_file_inplace():
+    """
+    Test that whole_file and inplace are passed on as rsync options
+    """
+    ret = {"pid": 100, "retcode": 0, "stderr": "", "stdout": ""}
+    with patch("os.path.exists", MagicMock(return_value=True)):
+        with patch.dict(rsync.__opts__, {"test": False}):
+            mock = MagicMock(return_value=ret)
+            with patch.dict(rsync.__salt__, {"rsync.rsync": mock}):
+                rsync.synchronized(
+                    "name",
+                    "source",
+                    additional_opts=["--checksum"],
+                    whole_file=True,
+                    inplace=True,
+                )
+                assert mock.call_args[1]["additional_opts"] == [
+                    "--checksum",
+                    "--whole-file",
+                    "--inplace",
+                ]
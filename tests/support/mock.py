@@ -17,6 +17,8 @@
 import copy
 import errno
 import fnmatch
+import os
+import re
 import sys
 
 # By these days, we should blowup if mock is not available
@@ -63,10 +65,11 @@ class MockFH:
         self.write_mode = any(x in self.mode for x in ("w", "a", "+"))
         self.empty_string = b"" if self.binary_mode else ""
         self.call = MockCall(filename, *args, **kwargs)
-        self.read_data_iter = self._iterate_read_data(read_data)
         self.read = Mock(side_effect=self._read)
         self.readlines = Mock(side_effect=self._readlines)
         self.readline = Mock(side_effect=self._readline)
+        self._write_calls = []
+        self._writelines_calls = []
         self.write = Mock(side_effect=self._write)
         self.writelines = Mock(side_effect=self._writelines)
         self.close = Mock()
@@ -74,43 +77,34 @@ class MockFH:
         self.__loc = 0
         self.__read_data_ok = False
 
-    def _iterate_read_data(self, read_data):
+    def _next_line(self):
         """
         Helper for mock_open:
-        Retrieve lines from read_data via a generator so that separate calls to
-        readline, read, and readlines are properly interleaved
+        Return the next line of read_data (including its newline) and advance
+        the position past it, so that separate calls to readline, read, and
+        readlines are properly interleaved. Returns an empty string once all
+        of read_data has been read.
         """
-        # Newline will always be a bytestring on PY2 because mock_open will have
-        # normalized it to one.
-        newline = b"\n" if isinstance(read_data, bytes) else "\n"
-
-        read_data = [line + newline for line in read_data.split(newline)]
-
-        if read_data[-1] == newline:
-            # If the last line ended in a newline, the list comprehension will have an
-            # extra entry that's just a newline. Remove this.
-            read_data = read_data[:-1]
-        else:
-            # If there wasn't an extra newline by itself, then the file being
-            # emulated doesn't have a newline to end the last line, so remove the
-            # newline that we added in the list comprehension.
-            read_data[-1] = read_data[-1][:-1]
-
-        yield from read_data
+        newline = b"\n" if isinstance(self.read_data, bytes) else "\n"
+        end = self.read_data.find(newline, self.__loc)
+        end = len(self.read_data) if end == -1 else end + 1
+        ret = self.read_data[self.__loc : end]
+        self.__loc = end
+        return ret
 
     @property
     def write_calls(self):
         """
         Return a list of all calls to the .write() mock
         """
-        return [x[1][0] for x in self.write.mock_calls]
+        return list(self._write_calls)
 
     @property
     def writelines_calls(self):
         """
         Return a list of all calls to the .writelines() mock
         """
-        return [x[1][0] for x in self.writelines.mock_calls]
+        return list(self._writelines_calls)
 
     def tell(self):
         return self.__loc
@@ -143,54 +137,42 @@ class MockFH:
         if not isinstance(size, int) or size < 0:
             raise TypeError("a positive integer is required")
 
-        joined = self.empty_string.join(self.read_data_iter)
         if not size:
-            # read() called with no args, return everything
-            self.__loc += len(joined)
-            return joined
+            # read() called with no args, return everything that is left
+            ret = self.read_data[self.__loc :]
         else:
             # read() called with an explicit size. Return a slice matching the
-            # requested size, but before doing so, reset read_data to reflect
-            # what we read.
-            self.read_data_iter = self._iterate_read_data(joined[size:])
-            ret = joined[:size]
-            self.__loc += len(ret)
-            return ret
+            # requested size.
+            ret = self.read_data[self.__loc : self.__loc + size]
+        self.__loc += len(ret)
+        return ret
 
     def _readlines(self, size=None):  # pylint: disable=unused-argument
         # TODO: Implement "size" argument
         self.__check_read_data()
         if not self.read_mode:
             raise OSError("File not open for reading")
-        ret = list(self.read_data_iter)
-        self.__loc += sum(len(x) for x in ret)
-        return ret
+        return list(iter(self._next_line, self.empty_string))
 
     def _readline(self, size=None):  # pylint: disable=unused-argument
         # TODO: Implement "size" argument
         self.__check_read_data()
         if not self.read_mode:
             raise OSError("File not open for reading")
-        try:
-            ret = next(self.read_data_iter)
-            self.__loc += len(ret)
-            return ret
-        except StopIteration:
-            return self.empty_string
+        return self._next_line()
 
     def __iter__(self):
         self.__check_read_data()
         if not self.read_mode:
             raise OSError("File not open for reading")
-        while True:
-            try:
-                ret = next(self.read_data_iter)
-                self.__loc += len(ret)
-                yield ret
-            except StopIteration:
-                break
+        yield from iter(self._next_line, self.empty_string)
 
     def _write(self, content):
+        # Like the mock's own call list, record the call even if it fails
+        self._write_calls.append(content)
+        self._check_write(content)
+
+    def _check_write(self, content):
         if not self.write_mode:
             raise OSError("File not open for writing")
         else:
@@ -207,10 +189,11 @@ class MockFH:
                 )
 
     def _writelines(self, lines):
+        self._writelines_calls.append(lines)
         if not self.write_mode:
             raise OSError("File not open for writing")
         for line in lines:
-            self._write(line)
+            self._check_write(line)
 
     def __enter__(self):
         return self
@@ -357,6 +340,12 @@ class MockOpen:
             read_data = {"*": read_data}
 
         self.read_data = read_data
+        # Translate the glob patterns once rather than on every open
+        self._matchers = [
+            (pat, re.compile(fnmatch.translate(os.path.normcase(pat))))
+            for pat in read_data
+            if pat != "*"
+        ]
         self.filehandles = {}
         self.calls = []
         self.call_count = 0
@@ -369,10 +358,9 @@ class MockOpen:
         call = MockCall(name, *args, **kwargs)
         self.calls.append(call)
         self.call_count += 1
-        for pat in self.read_data:
-            if pat == "*":
-                continue
-            if fnmatch.fnmatch(name, pat):
+        normname = os.path.normcase(name)
+        for pat, regex in self._matchers:
+            if regex.match(normname):
                 matched_pattern = pat
                 break
         else:
@@ -411,16 +399,28 @@ class MockOpen:
             # not exist and raise the appropriate exception.
             raise OSError(errno.ENOENT, "No such file or directory", name)
 
+    def _handles(self, path=None):
+        """
+        Yield the filehandles opened for files matching the `path` pattern, or
+        all filehandles if no pattern is given
+        """
+        if path is None:
+            for handles in self.filehandles.values():
+                yield from handles
+            return
+        regex = re.compile(fnmatch.translate(os.path.normcase(path)))
+        for filename, handles in self.filehandles.items():
+            if regex.match(os.path.normcase(filename)):
+                yield from handles
+
     def write_calls(self, path=None):
         """
         Returns the contents passed to all .write() calls. Use `path` to narrow
         the results to files matching a given pattern.
         """
         ret = []
-        for filename, handles in self.filehandles.items():
-            if path is None or fnmatch.fnmatch(filename, path):
-                for fh_ in handles:
-                    ret.extend(fh_.write_calls)
+        for fh_ in self._handles(path):
+            ret.extend(fh_._write_calls)
         return ret
 
     def writelines_calls(self, path=None):
@@ -429,10 +429,8 @@ class MockOpen:
         narrow the results to files matching a given pattern.
         """
         ret = []
-        for filename, handles in self.filehandles.items():
-            if path is None or fnmatch.fnmatch(filename, path):
-                for fh_ in handles:
-                    ret.extend(fh_.writelines_calls)
+        for fh_ in self._handles(path):
+            ret.extend(fh_._writelines_calls)
         return ret
 
 
@@ -51,6 +51,9 @@ error_message = (
     "An error occurred (101) when calling the {0} operation: Test-defined error"
 )
 error_content = {"Error": {"Code": 101, "Message": "Test-defined error"}}
+not_found_error_content = {
+    "Error": {"Code": "ResourceNotFoundException", "Message": "Test-defined error"}
+}
 function_ret = dict(
     FunctionName="testfunction",
     Runtime="python2.7",
@@ -172,7 +175,7 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests checking lambda function existence when the lambda function already exists
         """
-        self.conn.list_functions.return_value = {"Functions": [function_ret]}
+        self.conn.get_function_configuration.return_value = function_ret
         func_exists_result = boto_lambda.function_exists(
             FunctionName=function_ret["FunctionName"], **conn_parameters
         )
@@ -185,7 +188,9 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests checking lambda function existence when the lambda function does not exist
         """
-        self.conn.list_functions.return_value = {"Functions": [function_ret]}
+        self.conn.get_function_configuration.side_effect = ClientError(
+            not_found_error_content, "get_function_configuration"
+        )
         func_exists_result = boto_lambda.function_exists(
             FunctionName="myfunc", **conn_parameters
         )
@@ -198,8 +203,8 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests checking lambda function existence when boto returns an error
         """
-        self.conn.list_functions.side_effect = ClientError(
-            error_content, "list_functions"
+        self.conn.get_function_configuration.side_effect = ClientError(
+            error_content, "get_function_configuration"
         )
         func_exists_result = boto_lambda.function_exists(
             FunctionName="myfunc", **conn_parameters
@@ -207,7 +212,7 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
 
         self.assertEqual(
             func_exists_result.get("error", {}).get("message"),
-            error_message.format("list_functions"),
+            error_message.format("get_function_configuration"),
         )
 
     def test_that_when_creating_a_function_from_zipfile_succeeds_the_create_function_method_returns_true(
@@ -333,6 +338,32 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
             error_message.format("create_function"),
         )
 
+    def test_that_when_creating_a_function_from_zipfile_the_mapped_file_is_closed(
+        self,
+    ):
+        """
+        tests that the memory-mapped zip file is closed once the function is
+        created, and when creating it fails
+        """
+        with patch.dict(
+            boto_lambda.__salt__,
+            {"boto_iam.get_account_id": MagicMock(return_value="1234")},
+        ):
+            for side_effect in (None, ClientError(error_content, "create_function")):
+                self.conn.create_function.side_effect = side_effect
+                self.conn.create_function.return_value = function_ret
+                with TempZipFile() as zipfile:
+                    boto_lambda.create_function(
+                        FunctionName="testfunction",
+                        Runtime="python2.7",
+                        Role="myrole",
+                        Handler="file.method",
+                        ZipFile=zipfile,
+                        **conn_parameters
+                    )
+                code = self.conn.create_function.call_args[1]["Code"]
+                self.assertTrue(code["ZipFile"].closed)
+
     def test_that_when_deleting_a_function_succeeds_the_delete_function_method_returns_true(
         self,
     ):
@@ -373,7 +404,7 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests describing parameters if function exists
         """
-        self.conn.list_functions.return_value = {"Functions": [function_ret]}
+        self.conn.get_function_configuration.return_value = function_ret
 
         with patch.dict(
             boto_lambda.__salt__,
@@ -391,7 +422,9 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests describing parameters if function does not exist
         """
-        self.conn.list_functions.return_value = {"Functions": []}
+        self.conn.get_function_configuration.side_effect = ClientError(
+            not_found_error_content, "get_function_configuration"
+        )
         with patch.dict(
             boto_lambda.__salt__,
             {"boto_iam.get_account_id": MagicMock(return_value="1234")},
@@ -406,14 +439,62 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
         """
         Tests describing parameters failure
         """
-        self.conn.list_functions.side_effect = ClientError(
-            error_content, "list_functions"
+        self.conn.get_function_configuration.side_effect = ClientError(
+            error_content, "get_function_configuration"
         )
         result = boto_lambda.describe_function(
             FunctionName="testfunction", **conn_parameters
         )
         self.assertTrue("error" in result)
 
+    def test_that_when_checking_and_describing_a_function_the_lookup_is_only_made_once(
+        self,
+    ):
+        """
+        Tests that function lookups are cached until the function is modified
+        """
+        self.conn.get_function_configuration.return_value = function_ret
+        boto_lambda.function_exists(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        result = boto_lambda.describe_function(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        self.assertEqual(result, {"function": function_ret})
+        self.assertEqual(self.conn.get_function_configuration.call_count, 1)
+
+        boto_lambda.delete_function(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        boto_lambda.function_exists(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        self.assertEqual(self.conn.get_function_configuration.call_count, 2)
+
+    def test_that_a_function_lookup_by_arn_is_invalidated_by_its_name(self):
+        """
+        Tests that cached lookups are keyed by the function name, whether the
+        function was given by name or ARN, and don't keep the secret key
+        """
+        function_arn = "arn:aws:lambda:us-east-1:1234:function:{}".format(
+            function_ret["FunctionName"]
+        )
+        self.conn.get_function_configuration.return_value = function_ret
+        boto_lambda.function_exists(FunctionName=function_arn, **conn_parameters)
+        boto_lambda.function_exists(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        self.assertEqual(self.conn.get_function_configuration.call_count, 1)
+        self.assertNotIn(
+            conn_parameters["key"], str(boto_lambda.__context__["boto_lambda.lookups"])
+        )
+
+        boto_lambda.delete_function(
+            FunctionName=function_ret["FunctionName"], **conn_parameters
+        )
+        boto_lambda.function_exists(FunctionName=function_arn, **conn_parameters)
+        self.assertEqual(self.conn.get_function_configuration.call_count, 2)
+
     def test_that_when_updating_a_function_succeeds_the_update_function_method_returns_true(
         self,
     ):
@@ -474,6 +555,22 @@ class BotoLambdaFunctionTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin
 
         self.assertTrue(result["updated"])
 
+    def test_that_when_updating_function_code_from_zipfile_the_mapped_file_is_closed(
+        self,
+    ):
+        """
+        tests that the memory-mapped zip file is closed after the update
+        """
+        with TempZipFile() as zipfile:
+            self.conn.update_function_code.return_value = function_ret
+            boto_lambda.update_function_code(
+                FunctionName=function_ret["FunctionName"],
+                ZipFile=zipfile,
+                **conn_parameters
+            )
+        zipdata = self.conn.update_function_code.call_args[1]["ZipFile"]
+        self.assertTrue(zipdata.closed)
+
     def test_that_when_updating_function_code_from_s3_succeeds_the_update_function_method_returns_true(
         self,
     ):
@@ -669,7 +766,7 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests checking lambda alias existence when the lambda alias already exists
         """
-        self.conn.list_aliases.return_value = {"Aliases": [alias_ret]}
+        self.conn.get_alias.return_value = alias_ret
         result = boto_lambda.alias_exists(
             FunctionName="testfunction", Name=alias_ret["Name"], **conn_parameters
         )
@@ -681,7 +778,9 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests checking lambda alias existence when the lambda alias does not exist
         """
-        self.conn.list_aliases.return_value = {"Aliases": [alias_ret]}
+        self.conn.get_alias.side_effect = ClientError(
+            not_found_error_content, "get_alias"
+        )
         result = boto_lambda.alias_exists(
             FunctionName="testfunction", Name="otheralias", **conn_parameters
         )
@@ -694,13 +793,13 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests checking lambda alias existence when boto returns an error
         """
-        self.conn.list_aliases.side_effect = ClientError(error_content, "list_aliases")
+        self.conn.get_alias.side_effect = ClientError(error_content, "get_alias")
         result = boto_lambda.alias_exists(
             FunctionName="testfunction", Name=alias_ret["Name"], **conn_parameters
         )
 
         self.assertEqual(
-            result.get("error", {}).get("message"), error_message.format("list_aliases")
+            result.get("error", {}).get("message"), error_message.format("get_alias")
         )
 
     def test_that_when_describing_alias_it_returns_the_dict_of_properties_returns_true(
@@ -709,7 +808,7 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests describing parameters if alias exists
         """
-        self.conn.list_aliases.return_value = {"Aliases": [alias_ret]}
+        self.conn.get_alias.return_value = alias_ret
 
         result = boto_lambda.describe_alias(
             FunctionName="testfunction", Name=alias_ret["Name"], **conn_parameters
@@ -723,7 +822,9 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests describing parameters if alias does not exist
         """
-        self.conn.list_aliases.return_value = {"Aliases": [alias_ret]}
+        self.conn.get_alias.side_effect = ClientError(
+            not_found_error_content, "get_alias"
+        )
         result = boto_lambda.describe_alias(
             FunctionName="testfunction", Name="othername", **conn_parameters
         )
@@ -734,7 +835,7 @@ class BotoLambdaAliasTestCase(BotoLambdaTestCaseBase, BotoLambdaTestCaseMixin):
         """
         Tests describing parameters failure
         """
-        self.conn.list_aliases.side_effect = ClientError(error_content, "list_aliases")
+        self.conn.get_alias.side_effect = ClientError(error_content, "get_alias")
         result = boto_lambda.describe_alias(
             FunctionName="testfunction", Name=alias_ret["Name"], **conn_parameters
         )
@@ -901,6 +1002,29 @@ class BotoLambdaEventSourceMappingTestCase(
         )
         self.assertTrue(result["deleted"])
 
+    def test_that_when_deleting_an_event_source_mapping_by_name_the_connection_parameters_are_used_for_the_lookup(
+        self,
+    ):
+        """
+        tests the mapping ids are looked up with the given credentials.
+        """
+        get_ids = MagicMock(return_value=[event_source_mapping_ret["UUID"]])
+        with patch.object(boto_lambda, "get_event_source_mapping_ids", get_ids):
+            result = boto_lambda.delete_event_source_mapping(
+                EventSourceArn=event_source_mapping_ret["EventSourceArn"],
+                FunctionName=event_source_mapping_ret["FunctionArn"],
+                **conn_parameters
+            )
+        self.assertTrue(result["deleted"])
+        get_ids.assert_called_once_with(
+            EventSourceArn=event_source_mapping_ret["EventSourceArn"],
+            FunctionName=event_source_mapping_ret["FunctionArn"],
+            **conn_parameters
+        )
+        self.conn.delete_event_source_mapping.assert_called_once_with(
+            UUID=event_source_mapping_ret["UUID"]
+        )
+
     def test_that_when_deleting_an_event_source_mapping_without_identifier_the_delete_event_source_mapping_method_raises_saltinvocationexception(
         self,
     ):
@@ -928,6 +1052,31 @@ class BotoLambdaEventSourceMappingTestCase(
         )
         self.assertFalse(result["deleted"])
 
+    def test_that_when_deleting_several_event_source_mappings_fails_every_failure_is_reported(
+        self,
+    ):
+        """
+        tests that the error of each failed mapping is returned by UUID.
+        """
+        uuids = ["uuid-1", "uuid-2", "uuid-3"]
+
+        def delete(UUID):
+            if UUID != "uuid-2":
+                raise ClientError(error_content, "delete_event_source_mapping")
+
+        self.conn.delete_event_source_mapping.side_effect = delete
+        get_ids = MagicMock(return_value=uuids)
+        with patch.object(boto_lambda, "get_event_source_mapping_ids", get_ids):
+            result = boto_lambda.delete_event_source_mapping(
+                EventSourceArn=event_source_mapping_ret["EventSourceArn"],
+                FunctionName=event_source_mapping_ret["FunctionArn"],
+                **conn_parameters
+            )
+        self.assertFalse(result["deleted"])
+        self.assertEqual(set(result["errors"]), {"uuid-1", "uuid-3"})
+        self.assertEqual(result["error"], result["errors"]["uuid-1"])
+        self.assertEqual(self.conn.delete_event_source_mapping.call_count, 3)
+
     def test_that_when_checking_if_an_event_source_mapping_exists_and_the_event_source_mapping_exists_the_event_source_mapping_exists_method_returns_true(
         self,
     ):
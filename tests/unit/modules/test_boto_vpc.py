@@ -754,6 +754,34 @@ class BotoVpcSubnetsTestCase(BotoVpcTestCaseBase, BotoVpcTestCaseMixin):
         )
         self.assertEqual(set(subnet_association["vpc_ids"]), {vpc_a.id, vpc_b.id})
 
+    @mock_ec2_deprecated
+    def test_get_subnet_association_three_subnets_three_vpcs(self):
+        """
+        tests that given subnet ids in three different VPCs all three VPC ids
+        are returned.
+        """
+        vpcs = [self.conn.create_vpc(cidr_block) for _ in range(3)]
+        subnets = [self._create_subnet(vpc.id, "10.0.0.0/24") for vpc in vpcs]
+        subnet_association = boto_vpc.get_subnet_association(
+            [subnet.id for subnet in subnets], **conn_parameters
+        )
+        self.assertEqual(set(subnet_association["vpc_ids"]), {vpc.id for vpc in vpcs})
+
+    @mock_ec2_deprecated
+    def test_get_subnet_association_unknown_subnet_after_different_vpcs(self):
+        """
+        tests that an unknown subnet id is reported as an error even when it
+        follows subnets in different VPCs.
+        """
+        vpc_a = self._create_vpc()
+        vpc_b = self.conn.create_vpc(cidr_block)
+        subnet_a = self._create_subnet(vpc_a.id, "10.0.0.0/24")
+        subnet_b = self._create_subnet(vpc_b.id, "10.0.0.0/24")
+        subnet_association = boto_vpc.get_subnet_association(
+            [subnet_a.id, subnet_b.id, "subnet-a1b2c3d4"], **conn_parameters
+        )
+        self.assertIn("error", subnet_association)
+
     @mock_ec2_deprecated
     def test_that_when_creating_a_subnet_succeeds_the_create_subnet_method_returns_true(
         self,
@@ -876,6 +904,43 @@ class BotoVpcSubnetsTestCase(BotoVpcTestCaseBase, BotoVpcTestCaseMixin):
 
         self.assertFalse(subnet_exists_result["exists"])
 
+    @mock_ec2_deprecated
+    def test_that_when_a_subnet_is_deleted_the_cached_subnet_exists_result_is_dropped(
+        self,
+    ):
+        """
+        Tests that deleting a subnet invalidates the cached existence check
+        """
+        vpc = self._create_vpc()
+        subnet = self._create_subnet(vpc.id)
+
+        self.assertTrue(
+            boto_vpc.subnet_exists(subnet_id=subnet.id, **conn_parameters)["exists"]
+        )
+        boto_vpc.delete_subnet(subnet_id=subnet.id, **conn_parameters)
+
+        self.assertFalse(
+            boto_vpc.subnet_exists(subnet_id=subnet.id, **conn_parameters)["exists"]
+        )
+
+    @mock_ec2_deprecated
+    def test_that_when_checking_several_subnets_the_subnets_exist_method_reports_each_id(
+        self,
+    ):
+        """
+        Tests checking the existence of several subnets at once
+        """
+        vpc = self._create_vpc()
+        subnet = self._create_subnet(vpc.id)
+
+        subnets_exist_result = boto_vpc.subnets_exist(
+            [subnet.id, "subnet-fake"], **conn_parameters
+        )
+
+        self.assertEqual(
+            subnets_exist_result["exists"], {subnet.id: True, "subnet-fake": False}
+        )
+
     @mock_ec2_deprecated
     def test_that_when_checking_if_a_subnet_exists_by_name_the_subnet_exists_method_returns_true(
         self,
@@ -1427,6 +1492,40 @@ class BotoVpcDHCPOptionsTestCase(BotoVpcTestCaseBase, BotoVpcTestCaseMixin):
             )
             self.assertTrue("error" in r)
 
+    @mock_ec2_deprecated
+    def test_that_when_associating_new_dhcp_options_fails_the_create_dhcp_options_method_rolls_back(
+        self,
+    ):
+        """
+        Tests that dhcp options whose association fails are deleted again
+        """
+        vpc = self._create_vpc()
+        error = BotoServerError(400, "Mocked association error")
+        created = []
+
+        def associate_dhcp_options(dhcp_options_id, vpc_id):
+            # cache an exists answer for the new options set
+            created.append(dhcp_options_id)
+            self.assertTrue(
+                boto_vpc.dhcp_options_exists(dhcp_options_id, **conn_parameters)[
+                    "exists"
+                ]
+            )
+            raise error
+
+        with patch(
+            "boto.vpc.VPCConnection.associate_dhcp_options",
+            side_effect=associate_dhcp_options,
+        ):
+            r = boto_vpc.create_dhcp_options(vpc_id=vpc.id, **dhcp_options_parameters)
+
+        self.assertFalse(r["created"])
+        self.assertEqual(r["error"], boto_vpc.__utils__["boto.get_error"](error))
+        self.assertNotIn(created[0], [o.id for o in self.conn.get_all_dhcp_options()])
+        self.assertFalse(
+            boto_vpc.dhcp_options_exists(created[0], **conn_parameters)["exists"]
+        )
+
     @mock_ec2_deprecated
     def test_that_when_creating_dhcp_options_set_to_a_non_existent_vpc_the_dhcp_options_the_associate_new_dhcp_options_method_returns_false(
         self,
@@ -1658,6 +1757,35 @@ class BotoVpcNetworkACLTestCase(BotoVpcTestCaseBase, BotoVpcTestCaseMixin):
 
         self.assertTrue(network_acl_entry_creation_result)
 
+    @mock_ec2_deprecated
+    def test_that_when_applying_network_acl_entries_twice_the_second_run_changes_nothing(
+        self,
+    ):
+        """
+        Tests that apply_network_acl_entries skips entries that are already present
+        """
+        vpc = self._create_vpc()
+        network_acl = self._create_network_acl(vpc.id)
+        entries = [
+            {
+                "rule_number": 100,
+                "protocol": -1,
+                "rule_action": "allow",
+                "cidr_block": cidr_block,
+            }
+        ]
+
+        first = boto_vpc.apply_network_acl_entries(
+            entries, network_acl_id=network_acl.id, **conn_parameters
+        )
+        second = boto_vpc.apply_network_acl_entries(
+            entries, network_acl_id=network_acl.id, **conn_parameters
+        )
+
+        self.assertEqual(first["created"], [100])
+        self.assertEqual(second["created"], [])
+        self.assertEqual(second["unchanged"], [100])
+
     @mock_ec2_deprecated
     @pytest.mark.skip(reason="Moto has not implemented this feature. Skipping for now.")
     def test_that_when_creating_a_network_acl_entry_for_a_non_existent_network_acl_the_create_network_acl_entry_method_returns_false(
@@ -1863,6 +1991,44 @@ class BotoVpcNetworkACLTestCase(BotoVpcTestCaseBase, BotoVpcTestCaseMixin):
 
         self.assertFalse(network_acl_creation_and_association_result)
 
+    @mock_ec2_deprecated
+    def test_that_when_associating_a_new_network_acl_fails_the_create_network_acl_method_rolls_back(
+        self,
+    ):
+        """
+        Tests that a network acl whose association to a subnet fails is
+        deleted again
+        """
+        vpc = self._create_vpc()
+        subnet = self._create_subnet(vpc.id)
+        error = BotoServerError(400, "Mocked association error")
+        created = []
+
+        def associate_network_acl(network_acl_id, subnet_id):
+            # cache an exists answer for the new network acl
+            created.append(network_acl_id)
+            self.assertTrue(
+                boto_vpc.network_acl_exists(network_acl_id, **conn_parameters)["exists"]
+            )
+            raise error
+
+        with patch(
+            "boto.vpc.VPCConnection.associate_network_acl",
+            side_effect=associate_network_acl,
+        ):
+            r = boto_vpc.create_network_acl(
+                vpc.id, subnet_id=subnet.id, **conn_parameters
+            )
+
+        self.assertFalse(r["created"])
+        self.assertEqual(r["error"], boto_vpc.__utils__["boto.get_error"](error))
+        self.assertNotIn(
+            created[0], [acl.id for acl in self.conn.get_all_network_acls()]
+        )
+        self.assertFalse(
+            boto_vpc.network_acl_exists(created[0], **conn_parameters)["exists"]
+        )
+
     @mock_ec2_deprecated
     def test_that_when_creating_a_network_acl_to_a_non_existent_vpc_the_associate_new_network_acl_to_subnet_method_returns_an_error(
         self,